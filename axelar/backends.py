@@ -0,0 +1,186 @@
+import os
+import time
+import uuid
+from pathlib import Path
+
+import streamlit as st
+
+from axelar.connection import get_connection_pool
+from axelar.executor import run_queries
+from axelar.frames import arrow_to_frame, concat_frames
+from axelar.queries import fact_rows_queries, service_branch
+from axelar.staging import staging_rows_query
+from axelar.telemetry import telemetry
+
+# --- Warehouse Backends -----------------------------------------------------------------------------------------------
+# Where the fact store gets its rows from. Every backend has the same interface:
+#   - `fetch_fact_rows(since)` returns the flattened axelar_service rows created on or after `since` (all rows when
+#     None) with the fact store's columns, as one frame;
+#   - `iter_fact_row_batches(start_date, end_date)` yields the same rows for a date range as Arrow record batches
+#     straight off the result cursor, for exports too large to hold at once (see axelar.export).
+# Pick one with AXELAR_BACKEND=snowflake (default) or AXELAR_BACKEND=duckdb.
+
+EXPORT_BATCH_ROWS = 100_000
+
+
+class SnowflakeBackend:
+    # With a staging table (see axelar.staging) the rows come pre-parsed from it; otherwise from the fact tables
+    def __init__(self, pool, staging_table=None):
+        self.pool = pool
+        self.staging_table = staging_table
+
+    def fact_rows_queries(self, since=None, end_date=None):
+        if self.staging_table:
+            return {"staging": staging_rows_query(self.staging_table, since, end_date)}
+        return fact_rows_queries(since, end_date)
+
+    def fetch_fact_rows(self, since=None):
+        with self.pool.connection() as conn:
+            results = run_queries(conn, self.fact_rows_queries(since), loader="fact_rows")
+        return concat_frames(results.values())
+
+    # One query at a time, each read through the connector's Arrow result chunks, so only a chunk is in memory
+    def iter_fact_row_batches(self, start_date, end_date):
+        with self.pool.connection() as conn:
+            for name, query in self.fact_rows_queries(start_date, end_date).items():
+                cursor = conn.cursor()
+                try:
+                    started = time.perf_counter()
+                    cursor.execute(query)
+                    fetch_started = time.perf_counter()
+                    rows = 0
+                    for table in cursor.fetch_arrow_batches():
+                        rows += table.num_rows
+                        yield from table.to_batches()
+                    telemetry.record(
+                        "export", query=name, query_id=cursor.sfqid, queued_s=None,
+                        execution_s=fetch_started - started, fetch_s=time.perf_counter() - fetch_started, rows=rows,
+                        cache_hit=False,
+                    )
+                finally:
+                    cursor.close()
+
+
+# --- DuckDB Backend ---------------------------------------------------------------------------------------------------
+# An embedded stand-in for the warehouse: the same axelar_service flattening, in DuckDB's dialect, over Parquet files
+# shaped like axelar.axelscan.fact_transfers / fact_gmp with `data` as a JSON string (see axelar.fixtures). Lets the
+# whole data path run offline with no credentials.
+
+DEFAULT_FIXTURES = "fixtures"
+
+_DUCKDB_MACROS = """
+CREATE OR REPLACE MACRO variant_double(doc, path) AS
+  CASE
+    WHEN json_type(doc, path) IN ('ARRAY', 'OBJECT') THEN NULL
+    ELSE TRY_CAST(json_extract_string(doc, path) AS DOUBLE)
+  END;
+"""
+
+_DUCKDB_TOKEN_TRANSFERS_SELECT = """
+  SELECT
+    created_at,
+    LOWER(json_extract_string(data, '$.send.original_source_chain')) AS source_chain,
+    LOWER(json_extract_string(data, '$.send.original_destination_chain')) AS destination_chain,
+    sender_address AS "user",
+    variant_double(data, '$.send.amount') AS amount,
+    variant_double(data, '$.send.amount') * variant_double(data, '$.link.price') AS amount_usd,
+    variant_double(data, '$.send.fee_value') AS fee,
+    id,
+    'Token Transfers' AS "Service",
+    json_extract_string(data, '$.link.asset') AS raw_asset
+  FROM fact_transfers
+  WHERE status = 'executed'
+    AND simplified_status = 'received'
+"""
+
+_DUCKDB_GMP_SELECT = """
+  SELECT
+    created_at,
+    LOWER(json_extract_string(data, '$.call.chain')) AS source_chain,
+    LOWER(json_extract_string(data, '$.call.returnValues.destinationChain')) AS destination_chain,
+    json_extract_string(data, '$.call.transaction.from') AS "user",
+    variant_double(data, '$.amount') AS amount,
+    variant_double(data, '$.value') AS amount_usd,
+    COALESCE(
+      variant_double(data, '$.gas.gas_used_amount')
+        * variant_double(data, '$.gas_price_rate.source_token.token_price.usd'),
+      variant_double(data, '$.fees.express_fee_usd')
+    ) AS fee,
+    id,
+    'GMP' AS "Service",
+    json_extract_string(data, '$.symbol') AS raw_asset
+  FROM fact_gmp
+  WHERE status = 'executed'
+    AND simplified_status = 'received'
+"""
+
+
+def duckdb_fact_rows_query(since=None, end_date=None):
+    return f"""
+WITH axelar_service AS (
+{service_branch(_DUCKDB_TOKEN_TRANSFERS_SELECT, since, end_date)}
+  UNION ALL
+{service_branch(_DUCKDB_GMP_SELECT, since, end_date)}
+    )
+
+SELECT created_at, id, "user", source_chain, destination_chain, "Service" AS service,
+     amount, amount_usd, fee, raw_asset
+FROM axelar_service
+    """
+
+
+class DuckDBBackend:
+    def __init__(self, fixtures=DEFAULT_FIXTURES):
+        self.fixtures = Path(fixtures)
+
+    def connect(self):
+        import duckdb
+
+        con = duckdb.connect()
+        con.execute(_DUCKDB_MACROS)
+        for table in ("fact_transfers", "fact_gmp"):
+            files = str(self.fixtures / table / "*.parquet")
+            con.execute(f"CREATE VIEW {table} AS SELECT * FROM read_parquet('{files}')")
+        return con
+
+    def fetch_fact_rows(self, since=None):
+        con = self.connect()
+        try:
+            started = time.perf_counter()
+            result = con.execute(duckdb_fact_rows_query(since))
+            fetch_started = time.perf_counter()
+            rows = arrow_to_frame(result.fetch_arrow_table())
+        finally:
+            con.close()
+        # DuckDB has no query ids or scan statistics; the id is only there to tell records apart
+        telemetry.record(
+            "fact_rows", query="duckdb", query_id=str(uuid.uuid4()), queued_s=0.0,
+            execution_s=fetch_started - started, fetch_s=time.perf_counter() - fetch_started, rows=len(rows),
+            cache_hit=False,
+        )
+        return rows
+
+    def iter_fact_row_batches(self, start_date, end_date):
+        con = self.connect()
+        try:
+            started = time.perf_counter()
+            reader = con.execute(duckdb_fact_rows_query(start_date, end_date)).fetch_record_batch(EXPORT_BATCH_ROWS)
+            fetch_started = time.perf_counter()
+            rows = 0
+            for batch in reader:
+                rows += batch.num_rows
+                yield batch
+        finally:
+            con.close()
+        telemetry.record(
+            "export", query="duckdb", query_id=str(uuid.uuid4()), queued_s=0.0,
+            execution_s=fetch_started - started, fetch_s=time.perf_counter() - fetch_started, rows=rows,
+            cache_hit=False,
+        )
+
+
+@st.cache_resource
+def get_backend():
+    if os.environ.get("AXELAR_BACKEND", "snowflake") == "duckdb":
+        return DuckDBBackend(os.environ.get("AXELAR_FIXTURES", DEFAULT_FIXTURES))
+    return SnowflakeBackend(get_connection_pool(), st.secrets["snowflake"].get("staging_table"))
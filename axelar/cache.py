@@ -0,0 +1,106 @@
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+import pandas as pd
+
+# --- Bounded Result Cache ---------------------------------------------------------------------------------------------
+# An in-process key/value cache with a memory budget, so a server that runs for weeks holds at most `max_bytes` of
+# results however many distinct ranges are requested. Values are sized when stored (DataFrames by their deep memory
+# usage, other objects by their `nbytes` if they have one); when the budget is exceeded the least recently used ("lru") or least frequently used ("lfu") entries are
+# evicted. Entries older than `ttl` seconds are treated as missing. Counters for hits, misses, evictions, expirations
+# and bytes held are kept for the diagnostics panel.
+
+LRU = "lru"
+LFU = "lfu"
+
+
+def value_bytes(value):
+    if isinstance(value, pd.DataFrame):
+        return int(value.memory_usage(deep=True).sum())
+    if isinstance(value, pd.Series):
+        return int(value.memory_usage(deep=True))
+    if isinstance(value, (tuple, list)):
+        return sys.getsizeof(value) + sum(value_bytes(item) for item in value)
+    if hasattr(value, "nbytes"):
+        return int(value.nbytes)
+    return sys.getsizeof(value)
+
+
+class BoundedCache:
+    def __init__(self, max_bytes, ttl=None, policy=LRU, sizeof=value_bytes):
+        if policy not in (LRU, LFU):
+            raise ValueError(f"Unknown eviction policy {policy!r}")
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.policy = policy
+        self._sizeof = sizeof
+        self._entries = OrderedDict()  # key -> (value, size, stored_at, uses), least recently used first
+        self._bytes = 0
+        self._counters = dict.fromkeys(["hits", "misses", "evictions", "expirations", "invalidations"], 0)
+        self._lock = threading.Lock()
+
+    def _drop(self, key, counter):
+        _, size, _, _ = self._entries.pop(key)
+        self._bytes -= size
+        self._counters[counter] += 1
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl is not None and time.monotonic() - entry[2] > self.ttl:
+                self._drop(key, "expirations")
+                entry = None
+            if entry is None:
+                self._counters["misses"] += 1
+                return default
+            value, size, stored_at, uses = entry
+            self._entries[key] = (value, size, stored_at, uses + 1)
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            return value
+
+    # Like get, without counting a hit or miss or refreshing recency (for double-checked loads)
+    def peek(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else entry[0]
+
+    def put(self, key, value):
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._drop(key, "invalidations")
+            if size > self.max_bytes:
+                return False
+            while self._bytes + size > self.max_bytes:
+                self._drop(self._victim(), "evictions")
+            self._entries[key] = (value, size, time.monotonic(), 0)
+            self._bytes += size
+            return True
+
+    def _victim(self):
+        if self.policy == LFU:
+            # fewest uses; ties go to the least recently used
+            return min(self._entries, key=lambda key: self._entries[key][3])
+        return next(iter(self._entries))
+
+    def retain(self, keep):
+        with self._lock:
+            for key in [key for key in self._entries if not keep(key)]:
+                self._drop(key, "invalidations")
+
+    def clear(self):
+        self.retain(lambda key: False)
+
+    def stats(self):
+        with self._lock:
+            return {
+                **self._counters,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "policy": self.policy,
+                "ttl": self.ttl,
+            }
@@ -0,0 +1,118 @@
+import logging
+import time
+
+import snowflake.connector
+from snowflake.connector.constants import QueryStatus
+
+from axelar.frames import fetch_frame
+from axelar.telemetry import telemetry
+
+# --- Concurrent Query Execution ---------------------------------------------------------------------------------------
+# All queries are submitted up front with Snowflake's async execution (one cursor each), then polled and fetched as
+# they finish. Wall time is close to the slowest query instead of the sum of all of them.
+#
+# Each query is recorded in axelar.telemetry under `loader`. Queued and executing times are first taken from the
+# status polls, then replaced by the warehouse's own numbers (with bytes scanned) from the session's query history.
+#
+# If a query fails or the caller stops iterating early, the queries still running are cancelled in the warehouse
+# before the cursors are closed, so they do not keep running (and billing) with nobody waiting for them.
+
+POLL_INTERVAL = 0.25
+QUEUED_STATUSES = {QueryStatus.QUEUED, QueryStatus.QUEUED_REPARING_WAREHOUSE, QueryStatus.RESUMING_WAREHOUSE}
+
+logger = logging.getLogger(__name__)
+
+
+def _query_history(conn, query_ids):
+    ids = ", ".join(f"'{query_id}'" for query_id in query_ids)
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"""
+SELECT query_id,
+     (queued_overload_time + queued_provisioning_time + queued_repair_time) / 1000,
+     (compilation_time + execution_time) / 1000,
+     bytes_scanned
+FROM TABLE(INFORMATION_SCHEMA.QUERY_HISTORY_BY_SESSION(RESULT_LIMIT => 1000))
+WHERE query_id IN ({ids})
+        """)
+        return {row[0]: row[1:] for row in cursor.fetchall()}
+    except snowflake.connector.errors.Error:
+        # telemetry must never fail a load
+        logger.warning("query history lookup failed", exc_info=True)
+        return {}
+    finally:
+        cursor.close()
+
+
+def _cancel_queries(conn, query_ids):
+    for query_id in query_ids:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(f"SELECT SYSTEM$CANCEL_QUERY('{query_id}')")
+        except snowflake.connector.errors.Error:
+            # best effort: the query may have just finished, or the connection itself may be what failed
+            logger.warning("could not cancel query %s", query_id, exc_info=True)
+        finally:
+            cursor.close()
+
+
+def iter_query_results(conn, queries, poll_interval=POLL_INTERVAL, loader="warehouse"):
+    cursors = {}
+    records = {}
+    pending = {}
+    try:
+        for name, query in queries.items():
+            cursor = conn.cursor()
+            cursors[name] = cursor
+            cursor.execute_async(query)
+            pending[name] = cursor
+            records[name] = {"query": name, "query_id": cursor.sfqid, "submitted": time.perf_counter(), "started": None}
+
+        while pending:
+            finished = []
+            for name, cursor in pending.items():
+                status = conn.get_query_status_throw_if_error(cursor.sfqid)
+                record = records[name]
+                if record["started"] is None and status not in QUEUED_STATUSES:
+                    record["started"] = time.perf_counter()
+                if not conn.is_still_running(status):
+                    finished.append(name)
+            for name in finished:
+                cursor = pending.pop(name)
+                record = records[name]
+                record["queued_s"] = record["started"] - record["submitted"]
+                record["execution_s"] = time.perf_counter() - record["started"]
+                fetch_started = time.perf_counter()
+                cursor.get_results_from_sfqid(cursor.sfqid)
+                frame = fetch_frame(cursor)
+                record["fetch_s"] = time.perf_counter() - fetch_started
+                record["rows"] = len(frame)
+                yield name, frame
+            if pending and not finished:
+                time.sleep(poll_interval)
+
+        history = _query_history(conn, [record["query_id"] for record in records.values()])
+        for record in records.values():
+            queued_s, execution_s, bytes_scanned = history.get(record["query_id"], (None, None, None))
+            telemetry.record(
+                loader,
+                query=record["query"],
+                query_id=record["query_id"],
+                queued_s=record["queued_s"] if queued_s is None else float(queued_s),
+                execution_s=record["execution_s"] if execution_s is None else float(execution_s),
+                fetch_s=record["fetch_s"],
+                rows=record["rows"],
+                bytes_scanned=bytes_scanned,
+                cache_hit=False,
+            )
+    except BaseException:
+        # includes GeneratorExit, when the caller stops iterating before every result is fetched
+        _cancel_queries(conn, [cursor.sfqid for cursor in pending.values()])
+        raise
+    finally:
+        for cursor in cursors.values():
+            cursor.close()
+
+
+def run_queries(conn, queries, poll_interval=POLL_INTERVAL, loader="warehouse"):
+    return dict(iter_query_results(conn, queries, poll_interval, loader))
@@ -0,0 +1,89 @@
+import argparse
+import os
+import sys
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.csv as pacsv
+import pyarrow.parquet as pq
+
+from axelar.backends import get_backend
+from axelar.fact_store import ROW_SCHEMA, conform_rows
+from axelar.tokens import symbols
+
+# --- Transfer Row Export ----------------------------------------------------------------------------------------------
+# The transfer-level axelar_service rows for a date range (the same source / destination / token / fee normalization
+# the dashboard uses, plus the resolved token symbol), written to CSV or Parquet. Rows are streamed batch by batch from
+# the backend's result cursor to the file, so memory stays at one batch however many rows the range holds:
+#
+#     python -m axelar.export --start 2025-01-01 --end 2025-06-30 --out transfers.parquet
+#
+# The file is written next to its destination and moved into place when complete; a failed export leaves nothing.
+
+EXPORT_SCHEMA = ROW_SCHEMA.append(pa.field("symbol", pa.string()))
+FORMATS = ("csv", "parquet")
+DEFAULT_WINDOW_DAYS = 30
+
+
+def export_format(path):
+    suffix = Path(path).suffix.lstrip(".").lower()
+    return suffix if suffix in FORMATS else "csv"
+
+
+# Every chunk is cast to the fact store's row schema, plus the symbol
+def conform_batch(batch):
+    table = conform_rows(batch)
+    raw_assets = table.column("raw_asset").to_pandas()
+    symbol = pa.array(symbols(raw_assets).astype(object), type=pa.string())
+    return table.append_column(EXPORT_SCHEMA.field("symbol"), symbol)
+
+
+def _writer(path, fmt):
+    if fmt == "parquet":
+        return pq.ParquetWriter(path, EXPORT_SCHEMA)
+    return pacsv.CSVWriter(path, EXPORT_SCHEMA)
+
+
+def write_batches(batches, path, fmt=None):
+    path = Path(path)
+    fmt = fmt or export_format(path)
+    tmp_path = path.with_name(f".{path.name}.{uuid.uuid4().hex}.tmp")
+    rows = 0
+    try:
+        writer = _writer(tmp_path, fmt)
+        try:
+            for batch in batches:
+                table = conform_batch(batch)
+                writer.write_table(table)
+                rows += table.num_rows
+        finally:
+            writer.close()
+        os.replace(tmp_path, path)
+    finally:
+        tmp_path.unlink(missing_ok=True)
+    return rows
+
+
+def export_rows(backend, start_date, end_date, path, fmt=None):
+    return write_batches(backend.iter_fact_row_batches(start_date, end_date), path, fmt)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Export transfer-level rows for a date range to CSV or Parquet.")
+    parser.add_argument("--start", type=date.fromisoformat, help="first day (inclusive)")
+    parser.add_argument("--end", type=date.fromisoformat, help="last day (inclusive, default: today)")
+    parser.add_argument("--out", required=True, help="output file")
+    parser.add_argument("--format", choices=FORMATS, help="output format (default: from the --out suffix, else csv)")
+    args = parser.parse_args(argv)
+
+    end = args.end or date.today()
+    start = args.start or end - timedelta(days=DEFAULT_WINDOW_DAYS)
+    rows = export_rows(get_backend(), start, end, args.out, args.format)
+    print(f"{args.out}: {rows:,} rows created {start} to {end}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
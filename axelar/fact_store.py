@@ -0,0 +1,216 @@
+import json
+import os
+import shutil
+import threading
+import uuid
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import streamlit as st
+
+from axelar.frames import CATEGORY_COLUMNS, arrow_to_frame
+from axelar.tokens import symbols
+
+# --- Local Fact Store -------------------------------------------------------------------------------------------------
+# The flattened axelar_service rows, cached on disk as Parquet and partitioned by day (<root>/day=YYYY-MM-DD/*.parquet).
+# A `created_at` high-water mark is kept next to the partitions. A refresh only asks the warehouse for rows from the
+# last REFRESH_LOOKBACK_DAYS before the mark onwards and replaces those days. The lookback is what catches transfers
+# that reach executed / received some time after they were created (e.g. a GMP call executed after a gas top-up), so it
+# should cover the longest such delay that matters; set AXELAR_REFRESH_LOOKBACK_DAYS to widen it. Older days are never
+# fetched again.
+#
+# The very first refresh has no mark and reads the whole history. It streams it batch by batch off the result cursor
+# (the backend's iter_fact_row_batches): each batch is spooled to disk per day under <root>/_backfill, and each day's
+# spool is then compacted into its partition, so memory holds one batch or one day, never the full history.
+#
+# A deterministic SAMPLE_RATE share of each day's rows is kept in a parallel tree (<root>/_sample/day=...) for the
+# page's preview mode. Rows are picked by a hash of the transfer id, so a transfer is in the sample on every refresh
+# or never, and both services are sampled at the same rate.
+
+DEFAULT_ROOT = ".cache/axelar/fact_rows"
+REFRESH_INTERVAL = 600
+REFRESH_LOOKBACK_DAYS = int(os.environ.get("AXELAR_REFRESH_LOOKBACK_DAYS", 7))
+READ_ATTEMPTS = 3
+SAMPLE_MODULUS = 20
+SAMPLE_RATE = 1 / SAMPLE_MODULUS
+SAMPLE_BATCH_DAYS = 31
+
+# Fixed on disk so that a day whose column happens to be all NULL does not get a different schema from the rest
+ROW_SCHEMA = pa.schema([
+    ("created_at", pa.timestamp("ns")),
+    ("id", pa.string()),
+    ("user", pa.string()),
+    ("source_chain", pa.string()),
+    ("destination_chain", pa.string()),
+    ("service", pa.string()),
+    ("amount", pa.float64()),
+    ("amount_usd", pa.float64()),
+    ("fee", pa.float64()),
+    ("raw_asset", pa.string()),
+])
+ROW_COLUMNS = ROW_SCHEMA.names
+
+
+# Cursor batches come with the warehouse's own column case and types (timestamp units, integer widths)
+def conform_rows(batch):
+    table = pa.Table.from_batches([batch]).rename_columns([name.lower() for name in batch.schema.names])
+    return table.select(ROW_COLUMNS).cast(ROW_SCHEMA)
+
+
+def sample_mask(ids):
+    return (pd.util.hash_pandas_object(ids.astype(object), index=False) % SAMPLE_MODULUS == 0).to_numpy()
+
+
+class FactStore:
+    def __init__(self, root=DEFAULT_ROOT):
+        self.root = Path(root)
+        self._lock = threading.Lock()
+
+    # --- Watermark -------------------------------------------------------------------------------------------------
+    @property
+    def _watermark_path(self):
+        return self.root / "_watermark.json"
+
+    @property
+    def watermark(self):
+        try:
+            with open(self._watermark_path) as f:
+                return datetime.fromisoformat(json.load(f)["created_at"])
+        except FileNotFoundError:
+            return None
+
+    def _set_watermark(self, created_at):
+        tmp_path = self._watermark_path.with_suffix(".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump({"created_at": created_at.isoformat()}, f)
+        os.replace(tmp_path, self._watermark_path)
+
+    # --- Partitions ------------------------------------------------------------------------------------------------
+    def _day_dir(self, day, sample=False):
+        return (self.root / "_sample" if sample else self.root) / f"day={day}"
+
+    def days(self):
+        if not self.root.exists():
+            return []
+        return sorted(date.fromisoformat(p.name[len("day="):]) for p in self.root.glob("day=*") if p.is_dir())
+
+    # The day's current file: the newest one, in case a rewrite has not yet removed the file it replaces
+    def _day_file(self, day, sample=False):
+        return max(self._day_dir(day, sample).glob("*.parquet"), key=lambda path: path.stat().st_mtime_ns, default=None)
+
+    def partition_mtime(self, day, sample=False):
+        return max((path.stat().st_mtime for path in self._day_dir(day, sample).glob("*.parquet")), default=None)
+
+    def _write_day(self, day, rows, sample=False):
+        day_dir = self._day_dir(day, sample)
+        day_dir.mkdir(parents=True, exist_ok=True)
+        tmp_path = day_dir / f"part-{uuid.uuid4().hex}.parquet.tmp"
+        pq.write_table(pa.Table.from_pandas(rows, schema=ROW_SCHEMA, preserve_index=False), tmp_path)
+        # new file in first, old ones out after, so a concurrent read never finds the day empty; while both exist,
+        # reads take only the newest (see _day_file)
+        path = tmp_path.with_suffix("")
+        os.replace(tmp_path, path)
+        for old in day_dir.glob("*.parquet"):
+            if old != path:
+                old.unlink(missing_ok=True)
+
+    # --- Refresh ---------------------------------------------------------------------------------------------------
+    # First day a refresh starting from `watermark` rewrites; anything derived from later days is stale after it.
+    def refreshed_since(self, watermark):
+        if watermark is None:
+            return date.min
+        return watermark.date() - timedelta(days=REFRESH_LOOKBACK_DAYS)
+
+    def refresh(self, backend):
+        with self._lock:
+            watermark = self.watermark
+            if watermark is None:
+                watermark = self._backfill(backend)
+                self._sync_samples()
+                return watermark
+
+            rows = backend.fetch_fact_rows(self.refreshed_since(watermark))
+            if not rows.empty:
+                rows["created_at"] = pd.to_datetime(rows["created_at"])
+                for col in CATEGORY_COLUMNS:
+                    if col in rows:
+                        rows[col] = rows[col].astype(object)
+                days = rows["created_at"].dt.date
+                for day, day_rows in rows.groupby(days, sort=True):
+                    self._write_day(day, day_rows[ROW_COLUMNS])
+
+                watermark = rows["created_at"].max().to_pydatetime()
+                self.root.mkdir(parents=True, exist_ok=True)
+                self._set_watermark(watermark)
+            self._sync_samples()
+            return watermark
+
+    def _backfill(self, backend):
+        spool = self.root / "_backfill"
+        shutil.rmtree(spool, ignore_errors=True)
+        watermark = None
+        for i, batch in enumerate(backend.iter_fact_row_batches(None, None)):
+            rows = conform_rows(batch).to_pandas()
+            if rows.empty:
+                continue
+            for day, day_rows in rows.groupby(rows["created_at"].dt.date, sort=False):
+                day_dir = spool / f"day={day}"
+                day_dir.mkdir(parents=True, exist_ok=True)
+                pq.write_table(pa.Table.from_pandas(day_rows, schema=ROW_SCHEMA, preserve_index=False),
+                               day_dir / f"batch-{i}.parquet")
+            latest = rows["created_at"].max().to_pydatetime()
+            watermark = latest if watermark is None else max(watermark, latest)
+
+        for day_dir in sorted(spool.glob("day=*")):
+            day = date.fromisoformat(day_dir.name[len("day="):])
+            self._write_day(day, pq.read_table(day_dir, schema=ROW_SCHEMA).to_pandas())
+        shutil.rmtree(spool, ignore_errors=True)
+        if watermark is not None:
+            self._set_watermark(watermark)
+        return watermark
+
+    # Resamples every day whose partition is newer than its sample (the days just refreshed, and on the first run after
+    # an upgrade, every day), SAMPLE_BATCH_DAYS at a time
+    def _sync_samples(self):
+        stale = [day for day in self.days() if (self.partition_mtime(day, sample=True) or 0) < self.partition_mtime(day)]
+        for i in range(0, len(stale), SAMPLE_BATCH_DAYS):
+            batch = stale[i:i + SAMPLE_BATCH_DAYS]
+            table = self._read_table(batch[0], batch[-1], ROW_COLUMNS)
+            rows = table.to_pandas()
+            rows = rows[sample_mask(rows["id"])]
+            by_day = dict(tuple(rows.groupby(rows["created_at"].dt.date, sort=False)))
+            for day in batch:
+                self._write_day(day, by_day.get(day, rows.iloc[:0]), sample=True)
+
+    # --- Reads -----------------------------------------------------------------------------------------------------
+    # Rows come back with a `symbol` column resolved from raw_asset whenever raw_asset is read
+    def _read_table(self, start_date, end_date, columns, sample=False):
+        files = [str(path) for day in self.days() if start_date <= day <= end_date
+                 for path in [self._day_file(day, sample)] if path is not None]
+        if not files:
+            return ROW_SCHEMA.empty_table().select(columns or ROW_COLUMNS)
+        return ds.dataset(files, schema=ROW_SCHEMA, format="parquet").to_table(columns=columns)
+
+    # `sample` reads the SAMPLE_RATE row sample instead of every row
+    def read_rows(self, start_date, end_date, columns=None, sample=False):
+        for attempt in range(READ_ATTEMPTS):
+            try:
+                table = self._read_table(start_date, end_date, columns, sample)
+                break
+            except FileNotFoundError:
+                # a background refresh replaced a day's file between listing and reading it; list again
+                if attempt == READ_ATTEMPTS - 1:
+                    raise
+        rows = arrow_to_frame(table)
+        if "raw_asset" in rows:
+            rows["symbol"] = symbols(rows["raw_asset"])
+        return rows
+
+
+@st.cache_resource
+def get_fact_store():
+    return FactStore(os.environ.get("AXELAR_FACT_STORE", DEFAULT_ROOT))
@@ -0,0 +1,126 @@
+import argparse
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+# --- Synthetic Fact Tables --------------------------------------------------------------------------------------------
+# Parquet files shaped like axelar.axelscan.fact_transfers and fact_gmp, with `data` as the JSON text of the VARIANT
+# column, for the DuckDB backend and the benchmarks. Deterministic for a given seed. A small share of rows carries the
+# awkward shapes the page's SQL guards against (arrays, objects, numeric strings, mixed-case chain names, non-executed
+# statuses).
+#
+#     python -m axelar.fixtures --rows 1000000 --out fixtures
+
+CHAINS = [
+    "ethereum", "axelarnet", "osmosis", "arbitrum", "base", "polygon", "avalanche", "binance", "optimism", "moonbeam",
+    "fantom", "celo", "kujira", "neutron", "sei", "injective", "stride", "agoric", "filecoin", "linea",
+]
+TRANSFER_ASSETS = [
+    "uusdc", "uaxl", "weth-wei", "wbtc-satoshi", "uatom", "uosmo", "dai-wei", "uusdt", "polygon-uusdc", "frax-wei",
+    "factory/sei10hud5e5er4aul2l7sp2u9qp2lag5u4xf8mvyx38cnjvqhlgsrcls5qn5ke/seilor", "utia", "link-wei", "someunmapped",
+]
+GMP_SYMBOLS = ["USDC", "axlUSDC", "WETH", "USDT", "AXL", "ITS", "SQD", "WBTC", "PEPE"]
+
+CHUNK_ROWS = 1_000_000
+
+
+def _pick(rng, values, n, skew=1.2):
+    weights = 1 / np.arange(1, len(values) + 1) ** skew
+    return np.asarray(values, dtype=object)[rng.choice(len(values), n, p=weights / weights.sum())]
+
+
+def _number(rng, values):
+    text = pd.Series(values).map("{:.6f}".format)
+    shape = rng.random(len(values))
+    text[shape < 0.01] = "[" + text[shape < 0.01] + "]"
+    text[(shape >= 0.01) & (shape < 0.02)] = "{\"value\":" + text[(shape >= 0.01) & (shape < 0.02)] + "}"
+    text[(shape >= 0.02) & (shape < 0.05)] = "\"" + text[(shape >= 0.02) & (shape < 0.05)] + "\""
+    return text
+
+
+def _chain(rng, n):
+    chains = pd.Series(_pick(rng, CHAINS, n))
+    upper = rng.random(n) < 0.1
+    chains[upper] = chains[upper].str.capitalize()
+    return chains
+
+
+def _base(rng, n, start, days, id_prefix, offset):
+    created_at = pd.Timestamp(start) + pd.to_timedelta(rng.integers(0, days * 86_400, n), unit="s")
+    status = np.where(rng.random(n) < 0.97, "executed", "error")
+    return pd.DataFrame({
+        "created_at": created_at,
+        "id": pd.Series(np.arange(offset, offset + n)).map(f"{id_prefix}{{:012x}}".format),
+        "status": status,
+        "simplified_status": np.where(status == "executed", "received", "failed"),
+    })
+
+
+def _users(rng, n, n_users):
+    return pd.Series(rng.zipf(1.3, n) % n_users).map("0x{:040x}".format)
+
+
+def transfers_chunk(rng, n, start, days, n_users, offset=0):
+    df = _base(rng, n, start, days, "transfer-", offset)
+    df["sender_address"] = _users(rng, n, n_users)
+    df["data"] = (
+        "{\"send\":{\"original_source_chain\":\"" + _chain(rng, n)
+        + "\",\"original_destination_chain\":\"" + _chain(rng, n)
+        + "\",\"amount\":" + _number(rng, rng.lognormal(3, 2, n))
+        + ",\"fee_value\":" + _number(rng, rng.lognormal(-2, 1, n))
+        + "},\"link\":{\"asset\":\"" + pd.Series(_pick(rng, TRANSFER_ASSETS, n))
+        + "\",\"price\":" + _number(rng, rng.lognormal(0, 1, n)) + "}}"
+    )
+    return df
+
+
+def gmp_chunk(rng, n, start, days, n_users, offset=0):
+    df = _base(rng, n, start, days, "gmp-", offset)
+    df["data"] = (
+        "{\"call\":{\"chain\":\"" + _chain(rng, n)
+        + "\",\"returnValues\":{\"destinationChain\":\"" + _chain(rng, n)
+        + "\"},\"transaction\":{\"from\":\"" + _users(rng, n, n_users)
+        + "\"}},\"amount\":" + _number(rng, rng.lognormal(3, 2, n))
+        + ",\"value\":" + _number(rng, rng.lognormal(4, 2, n))
+        + ",\"gas\":{\"gas_used_amount\":" + _number(rng, rng.lognormal(-3, 1, n))
+        + "},\"gas_price_rate\":{\"source_token\":{\"token_price\":{\"usd\":" + _number(rng, rng.lognormal(0, 1, n))
+        + "}}},\"fees\":{\"express_fee_usd\":" + _number(rng, rng.lognormal(-2, 1, n))
+        + "},\"symbol\":\"" + pd.Series(_pick(rng, GMP_SYMBOLS, n)) + "\"}"
+    )
+    return df
+
+
+def write_fixtures(root, rows, start="2024-01-01", days=600, users=None, gmp_share=0.4, seed=0):
+    root = Path(root)
+    rng = np.random.default_rng(seed)
+    users = users or max(rows // 5, 1)
+    n_gmp = int(rows * gmp_share)
+    for table, make, total in (("fact_transfers", transfers_chunk, rows - n_gmp), ("fact_gmp", gmp_chunk, n_gmp)):
+        (root / table).mkdir(parents=True, exist_ok=True)
+        path = root / table / "part-0.parquet"
+        writer = None
+        try:
+            for offset in range(0, total, CHUNK_ROWS):
+                chunk = pa.Table.from_pandas(
+                    make(rng, min(CHUNK_ROWS, total - offset), start, days, users, offset), preserve_index=False
+                )
+                writer = writer or pq.ParquetWriter(path, chunk.schema)
+                writer.write_table(chunk)
+        finally:
+            if writer is not None:
+                writer.close()
+    return root
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Write synthetic fact_transfers / fact_gmp Parquet fixtures.")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--out", default="fixtures")
+    parser.add_argument("--start", default="2024-01-01")
+    parser.add_argument("--days", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+    write_fixtures(args.out, args.rows, start=args.start, days=args.days, seed=args.seed)
@@ -0,0 +1,75 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+
+# --- Arrow Result Fetching --------------------------------------------------------------------------------------------
+# Results come back through the connector's Arrow batches instead of the row-by-row DBAPI path. Name columns are
+# dictionary-encoded on the Arrow side so they land in pandas as categoricals without ever being materialized as Python
+# strings, and count columns are downcast to the narrowest signed integer that holds them. USD sums stay float64:
+# float32 would round large volumes.
+
+CATEGORY_COLUMNS = ("source_chain", "destination_chain", "raw_asset", "symbol", "service")
+
+
+def compact_dtypes(df, category_columns=CATEGORY_COLUMNS):
+    for col in df.columns:
+        if col in category_columns and not isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype("category")
+        elif pd.api.types.is_integer_dtype(df[col]):
+            df[col] = pd.to_numeric(df[col], downcast="integer")
+    return df
+
+
+def arrow_to_frame(table, category_columns=CATEGORY_COLUMNS):
+    for i, name in enumerate(table.column_names):
+        if name in category_columns:
+            table = table.set_column(i, name, pc.dictionary_encode(table.column(name)))
+    return compact_dtypes(table.to_pandas(), category_columns)
+
+
+def fetch_frame(cursor):
+    batches = list(cursor.fetch_arrow_batches())
+    if not batches:
+        return pd.DataFrame(columns=[column[0] for column in cursor.description])
+    return arrow_to_frame(pa.concat_tables(batches))
+
+
+# One categorical column from many pieces: the union of their categories (a handful of names each), and every piece's
+# codes remapped into it with a small lookup array, without recoding any piece as a pandas object
+def _concat_categoricals(columns):
+    # empty pieces (days without transfers) can carry a different categories dtype; they add no categories
+    with_rows = [column for column in columns if len(column)] or columns[:1]
+    positions = {}
+    for column in with_rows:
+        for category in column.categories:
+            positions.setdefault(category, len(positions))
+    codes = []
+    for column in columns:
+        # -1 (missing) stays -1: it indexes the sentinel at the end of the lookup
+        lookup = np.array([positions.get(category, -1) for category in column.categories] + [-1], dtype=np.int32)
+        codes.append(lookup[column.codes])
+    categories = pd.Index(list(positions), dtype=with_rows[0].categories.dtype)
+    return pd.Categorical.from_codes(np.concatenate(codes), categories=categories)
+
+
+# Column by column: per-piece DataFrame operations (aligning categories, dropping or casting columns) cost more than the
+# data itself when a range is hundreds of small day pieces. Category columns that are categorical in every piece are
+# built from codes, plain NumPy columns as arrays, and the rest (e.g. Arrow strings) as Series.
+def concat_frames(frames, category_columns=CATEGORY_COLUMNS):
+    frames = [df for df in frames if len(df.columns)]
+    if not frames:
+        return pd.DataFrame()
+    columns = list(frames[0].columns)
+    if any(list(df.columns) != columns for df in frames):
+        return compact_dtypes(pd.concat(frames, ignore_index=True), category_columns)
+    concatenated = {}
+    for col in columns:
+        pieces = [df[col] for df in frames]
+        if col in category_columns and all(isinstance(piece.dtype, pd.CategoricalDtype) for piece in pieces):
+            concatenated[col] = _concat_categoricals([piece.array for piece in pieces])
+        elif all(piece.dtype == pieces[0].dtype and isinstance(piece.dtype, np.dtype) for piece in pieces):
+            concatenated[col] = np.concatenate([piece.to_numpy() for piece in pieces])
+        else:
+            concatenated[col] = pd.concat(pieces, ignore_index=True)
+    return compact_dtypes(pd.DataFrame(concatenated), category_columns)
@@ -0,0 +1,54 @@
+import numpy as np
+import pandas as pd
+
+# --- HyperLogLog Distinct Counts --------------------------------------------------------------------------------------
+# Sparse, mergeable HyperLogLog sketches kept as plain DataFrames: one row per (group keys..., register) holding the
+# highest rank seen in that register. Sketches merge with a group-by max, so daily sketches can be combined into any
+# date range and re-grouped by any subset of their key columns.
+#
+# With PRECISION = 12 (4096 registers) the relative standard error of an estimate is 1.04 / sqrt(4096) ~= 1.6%, i.e.
+# about +/-3.3% at 95% confidence. Small counts (below 2.5 x 4096) use linear counting and are close to exact.
+
+PRECISION = 12
+REGISTERS = 1 << PRECISION
+STANDARD_ERROR = 1.04 / np.sqrt(REGISTERS)
+
+_RANK_BITS = 64 - PRECISION
+_ALPHA = 0.7213 / (1 + 1.079 / REGISTERS)
+
+
+def _registers(values):
+    # the hash is seeded with a fixed key, so sketches written by one process stay valid in the next
+    hashes = pd.util.hash_pandas_object(values, index=False).to_numpy()
+    register = (hashes >> np.uint64(_RANK_BITS)).astype(np.uint16)
+    # the low 52 bits fit a float64 exactly, so frexp's exponent is their exact bit length
+    _, bit_length = np.frexp((hashes & np.uint64((1 << _RANK_BITS) - 1)).astype(np.float64))
+    rank = (_RANK_BITS - bit_length + 1).astype(np.uint8)
+    return register, rank
+
+
+# The register and rank of every non-null value of `column`, hashed once for any number of sketches over the rows
+def ranks(frame, column):
+    frame = frame[frame[column].notna()]
+    register, rank = _registers(frame[column])
+    return frame.assign(register=register, rank=rank)
+
+
+def sketch(frame, keys, column):
+    return merge(ranks(frame, column)[keys + ["register", "rank"]], keys)
+
+
+def merge(sketches, keys):
+    grouped = sketches.groupby(keys + ["register"], sort=False, dropna=False, observed=True)
+    return grouped["rank"].max().reset_index()
+
+
+def estimate(sketches, by):
+    ranks = sketches.groupby([by, sketches["register"]], sort=False, dropna=False, observed=True)["rank"].max()
+    inverse = pd.Series(np.exp2(-ranks.to_numpy(dtype=np.float64)), index=ranks.index)
+    grouped = inverse.groupby(level=0, sort=False, dropna=False)
+
+    zeros = REGISTERS - grouped.size()
+    raw = _ALPHA * REGISTERS ** 2 / (grouped.sum() + zeros)
+    linear = REGISTERS * np.log(REGISTERS / zeros.where(zeros > 0))
+    return raw.where((raw > 2.5 * REGISTERS) | (zeros == 0), linear).round()
@@ -0,0 +1,97 @@
+import os
+import threading
+import time
+from datetime import timedelta
+
+import streamlit as st
+
+from axelar.cache import LRU, BoundedCache
+from axelar.telemetry import telemetry
+
+# --- Interval-Aware Result Cache --------------------------------------------------------------------------------------
+# Caches per-day partial results instead of whole (start, end) answers. For a new range only the uncovered runs of days
+# are loaded (one load call per contiguous gap) and the caller merges the per-day pieces, so widening or sliding the
+# window only costs the days that were not seen before.
+#
+# `version` is the data version the cached days belong to (the fact store watermark); `advance` drops the days a
+# newer version may have changed. The days themselves are held in a BoundedCache: a day evicted for memory or past
+# its TTL is simply loaded again with the next gap.
+
+ONE_DAY = timedelta(days=1)
+DEFAULT_MAX_BYTES = int(os.environ.get("AXELAR_CACHE_MB", 512)) * 2 ** 20
+DEFAULT_TTL = 6 * 3600
+
+
+def _days(start_date, end_date):
+    day = start_date
+    while day <= end_date:
+        yield day
+        day += ONE_DAY
+
+
+def _gaps(pieces):
+    gaps = []
+    gap_start = previous = None
+    for day, piece in pieces.items():
+        if piece is None:
+            gap_start = gap_start or day
+        elif gap_start is not None:
+            gaps.append((gap_start, previous))
+            gap_start = None
+        previous = day
+    if gap_start is not None:
+        gaps.append((gap_start, previous))
+    return gaps
+
+
+class IntervalCache:
+    def __init__(self, name="interval_cache", max_bytes=DEFAULT_MAX_BYTES, ttl=DEFAULT_TTL, policy=LRU):
+        self.name = name
+        self.version = None
+        self._days = BoundedCache(max_bytes, ttl, policy)
+        self._lock = threading.Lock()
+
+    def _pieces(self, start_date, end_date):
+        with self._lock:
+            return {day: self._days.get(day) for day in _days(start_date, end_date)}
+
+    def missing_intervals(self, start_date, end_date):
+        return _gaps(self._pieces(start_date, end_date))
+
+    def get(self, start_date, end_date, load, day_column="day"):
+        started = time.perf_counter()
+        version = self.version
+        pieces = self._pieces(start_date, end_date)
+        gaps = _gaps(pieces)
+        for gap_start, gap_end in gaps:
+            frame = load(gap_start, gap_end)
+            by_day = dict(tuple(frame.groupby(day_column, sort=False, observed=True)))
+            loaded = {day: by_day.get(day, frame.iloc[:0]) for day in _days(gap_start, gap_end)}
+            pieces.update(loaded)
+            with self._lock:
+                # a refresh that landed meanwhile may have changed these days; don't keep them
+                if self.version == version:
+                    for day, piece in loaded.items():
+                        self._days.put(day, piece)
+        telemetry.record(
+            self.name, query=f"{start_date}..{end_date}", execution_s=time.perf_counter() - started,
+            rows=sum(len(piece) for piece in pieces.values()), cache_hit=not gaps,
+        )
+        return list(pieces.values())
+
+    def advance(self, version, stale_since):
+        with self._lock:
+            if version == self.version:
+                return
+            self._days.retain(lambda day: day < stale_since)
+            self.version = version
+
+    def stats(self):
+        return self._days.stats()
+
+
+@st.cache_resource
+def get_interval_cache(name, max_bytes=DEFAULT_MAX_BYTES, ttl=DEFAULT_TTL, policy=LRU):
+    cache = IntervalCache(name, max_bytes, ttl, policy)
+    telemetry.register_cache(name, cache)
+    return cache
@@ -0,0 +1,119 @@
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date
+
+import streamlit as st
+
+from axelar.backends import get_backend
+from axelar.fact_store import REFRESH_INTERVAL, get_fact_store
+from axelar.interval_cache import get_interval_cache
+from axelar.rollups import get_rollup_store
+from axelar.sections import daily_facts_from_rows
+from axelar.telemetry import start_metrics_server
+
+# --- Background Refresh -----------------------------------------------------------------------------------------------
+# One daemon thread per server process refreshes the fact store from the warehouse every REFRESH_INTERVAL seconds,
+# syncs the rollups and then pre-loads the pages' default date ranges into the per-day facts cache. Pages never wait
+# on the warehouse: they read whatever the last completed refresh left behind (stale-while-revalidate) and only block
+# when the store has never been filled at all.
+
+DEFAULT_RANGES = {
+    "Cross-chain Transfers": (date(2025, 1, 1), date(2025, 8, 31)),
+    "Satellite": (date(2024, 1, 1), date(2025, 7, 31)),
+}
+
+LOAD_WORKERS = 2
+READY_TIMEOUT = 300
+READY_POLL_INTERVAL = 0.5
+
+logger = logging.getLogger(__name__)
+
+
+class Refresher:
+    def __init__(self, backend, store, rollups, facts_cache, interval=REFRESH_INTERVAL, ranges=DEFAULT_RANGES):
+        self.backend = backend
+        self.store = store
+        self.rollups = rollups
+        self.facts_cache = facts_cache
+        self.interval = interval
+        self.ranges = ranges
+        self.last_refresh = None
+        self.last_error = None
+        self._ready = threading.Event()
+        self._thread = None
+        self._start_lock = threading.Lock()
+        self._loads = ThreadPoolExecutor(max_workers=LOAD_WORKERS, thread_name_prefix="axelar-load")
+        self._pending = {}
+        if store.watermark is not None:
+            self._ready.set()
+
+    @property
+    def watermark(self):
+        return self.store.watermark
+
+    def load_daily_facts(self, start_date, end_date):
+        return daily_facts_from_rows(self.store.read_rows(start_date, end_date))
+
+    # Loads a range into the facts cache off the script thread (the page's preview mode shows a sample meanwhile) and
+    # returns the future of its day pieces. One load per range and data version while it runs, whoever asks; finished
+    # loads are dropped, since their callers hold the future and a later request (e.g. after a failure) loads again.
+    def load_in_background(self, start_date, end_date):
+        key = (start_date, end_date, self.facts_cache.version)
+        with self._start_lock:
+            self._pending = {k: f for k, f in self._pending.items() if not f.done()}
+            future = self._pending.get(key)
+            if future is None:
+                future = self._loads.submit(self.facts_cache.get, start_date, end_date, self.load_daily_facts)
+                self._pending[key] = future
+        return future
+
+    def refresh_once(self):
+        watermark = self.store.refresh(self.backend)
+        self.rollups.sync(self.store)
+        self.facts_cache.advance(watermark, self.store.refreshed_since(self.facts_cache.version))
+        self._ready.set()
+        for start_date, end_date in self.ranges.values():
+            self.facts_cache.get(start_date, end_date, self.load_daily_facts)
+        self.last_refresh = time.time()
+        return watermark
+
+    def _run(self):
+        while True:
+            try:
+                self.refresh_once()
+                self.last_error = None
+            except Exception as e:
+                # keep serving the last good store; the next cycle retries
+                self.last_error = e
+                logger.exception("background refresh failed")
+            time.sleep(self.interval)
+
+    def start(self):
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="axelar-refresh", daemon=True)
+                self._thread.start()
+        return self
+
+    # Blocks only while the store has never been filled. A failed first refresh is raised to every waiting page instead
+    # of leaving them waiting for the next cycle.
+    def wait_ready(self, timeout=READY_TIMEOUT):
+        deadline = time.monotonic() + timeout
+        while not self._ready.wait(READY_POLL_INTERVAL):
+            if self.last_error is not None:
+                raise RuntimeError("The first refresh of the fact store failed") from self.last_error
+            if time.monotonic() > deadline:
+                raise TimeoutError(f"The fact store was not filled within {timeout}s")
+        # the cache's version follows the store; a cold process picks up what is already on disk
+        watermark = self.watermark
+        self.facts_cache.advance(watermark, self.store.refreshed_since(self.facts_cache.version))
+        return watermark
+
+
+@st.cache_resource
+def get_refresher():
+    # the once-per-process services start together: the refresh thread and, if configured, the metrics endpoint
+    start_metrics_server()
+    return Refresher(get_backend(), get_fact_store(), get_rollup_store(), get_interval_cache("transfer_facts")).start()
@@ -0,0 +1,70 @@
+import argparse
+import sys
+from datetime import date, timedelta
+
+import pandas as pd
+import streamlit as st
+
+from axelar.backends import SnowflakeBackend
+from axelar.connection import get_connection_pool
+from axelar.fact_store import REFRESH_LOOKBACK_DAYS
+
+# --- Partition Pruning Check ------------------------------------------------------------------------------------------
+# Runs Snowflake's EXPLAIN on the warehouse queries the dashboard actually runs, i.e. the fact store refresh's fact-row
+# queries (from the staging table when `staging_table` is set in the [snowflake] secrets), and reports, per table scan,
+# how many micro-partitions the created_at predicates leave to read (partitionsAssigned) out of the table's total. A
+# scan assigned (nearly) every partition for a narrow date range means the predicate is not reaching the scan, e.g.
+# because it was wrapped in a cast again.
+#
+#     python -m axelar.pruning                                   # a routine refresh's window
+#     python -m axelar.pruning --since 2025-01-01 --end 2025-01-31 --max-ratio 0.1
+EXPLAIN_COLUMNS = ["operation", "objects", "partitionsAssigned", "partitionsTotal", "bytesAssigned"]
+
+
+def explain_scans(conn, query):
+    cursor = conn.cursor()
+    try:
+        cursor.execute(f"EXPLAIN USING TABULAR {query}")
+        plan = pd.DataFrame(cursor.fetchall(), columns=[column[0] for column in cursor.description])
+    finally:
+        cursor.close()
+    scans = plan.loc[plan["operation"] == "TableScan", EXPLAIN_COLUMNS]
+    return scans.rename(columns={"objects": "table"}).drop(columns="operation")
+
+
+def pruning_report(conn, queries):
+    frames = [explain_scans(conn, query).assign(query=name) for name, query in queries.items()]
+    report = pd.concat(frames, ignore_index=True)
+    report["scanned_ratio"] = report["partitionsAssigned"] / report["partitionsTotal"].where(report["partitionsTotal"] > 0)
+    return report[["query", "table", "partitionsAssigned", "partitionsTotal", "scanned_ratio", "bytesAssigned"]]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check micro-partition pruning of the Cross-chain Transfers queries.")
+    parser.add_argument("--since", type=date.fromisoformat,
+                        help=f"first day read (default: {REFRESH_LOOKBACK_DAYS} days ago, like a routine refresh)")
+    parser.add_argument("--end", type=date.fromisoformat, help="last day read (default: none, like a refresh)")
+    parser.add_argument("--staging-table", help="check this staging table (default: staging_table from the secrets)")
+    parser.add_argument("--max-ratio", type=float, help="exit non-zero if any scan reads more than this share")
+    args = parser.parse_args(argv)
+
+    since = args.since or date.today() - timedelta(days=REFRESH_LOOKBACK_DAYS)
+    staging_table = args.staging_table or st.secrets["snowflake"].get("staging_table")
+    backend = SnowflakeBackend(get_connection_pool(), staging_table)
+    queries = backend.fact_rows_queries(since, args.end)
+
+    with backend.pool.connection() as conn:
+        report = pruning_report(conn, queries)
+    print(report.to_string(index=False, float_format=lambda x: f"{x:,.3f}"))
+
+    if args.max_ratio is not None:
+        unpruned = report[report["scanned_ratio"] > args.max_ratio]
+        for r in unpruned.itertuples():
+            print(f"UNPRUNED {r.query} on {r.table}: {r.partitionsAssigned:,} of {r.partitionsTotal:,} partitions",
+                  file=sys.stderr)
+        return 1 if len(unpruned) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
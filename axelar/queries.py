@@ -0,0 +1,134 @@
+from datetime import timedelta
+
+# --- Shared SQL for the Cross-chain Transfers page --------------------------------------------------------------------
+# The unified Token Transfers + GMP fact set. Everything the dashboard reads from the warehouse (the fact store's rows,
+# the staging table, exports) is derived from these two branches, so they are written here once.
+
+TOKEN_TRANSFERS_SELECT = """
+  SELECT
+    created_at,
+    LOWER(data:send:original_source_chain) AS source_chain,
+    LOWER(data:send:original_destination_chain) AS destination_chain,
+    sender_address AS user,
+
+    CASE
+      WHEN IS_ARRAY(data:send:amount) THEN NULL
+      WHEN IS_OBJECT(data:send:amount) THEN NULL
+      WHEN TRY_TO_DOUBLE(data:send:amount::STRING) IS NOT NULL THEN TRY_TO_DOUBLE(data:send:amount::STRING)
+      ELSE NULL
+    END AS amount,
+
+    CASE
+      WHEN IS_ARRAY(data:send:amount) OR IS_ARRAY(data:link:price) THEN NULL
+      WHEN IS_OBJECT(data:send:amount) OR IS_OBJECT(data:link:price) THEN NULL
+      WHEN TRY_TO_DOUBLE(data:send:amount::STRING) IS NOT NULL AND TRY_TO_DOUBLE(data:link:price::STRING) IS NOT NULL
+        THEN TRY_TO_DOUBLE(data:send:amount::STRING) * TRY_TO_DOUBLE(data:link:price::STRING)
+      ELSE NULL
+    END AS amount_usd,
+
+    CASE
+      WHEN IS_ARRAY(data:send:fee_value) THEN NULL
+      WHEN IS_OBJECT(data:send:fee_value) THEN NULL
+      WHEN TRY_TO_DOUBLE(data:send:fee_value::STRING) IS NOT NULL THEN TRY_TO_DOUBLE(data:send:fee_value::STRING)
+      ELSE NULL
+    END AS fee,
+
+    id,
+    'Token Transfers' AS "Service",
+    data:link:asset::STRING AS raw_asset
+
+  FROM axelar.axelscan.fact_transfers
+  WHERE status = 'executed'
+    AND simplified_status = 'received'
+"""
+
+GMP_SELECT = """
+  SELECT
+    created_at,
+    LOWER(data:call.chain::STRING) AS source_chain,
+    LOWER(data:call.returnValues.destinationChain::STRING) AS destination_chain,
+    data:call.transaction.from::STRING AS user,
+
+    CASE
+      WHEN IS_ARRAY(data:amount) OR IS_OBJECT(data:amount) THEN NULL
+      WHEN TRY_TO_DOUBLE(data:amount::STRING) IS NOT NULL THEN TRY_TO_DOUBLE(data:amount::STRING)
+      ELSE NULL
+    END AS amount,
+
+    CASE
+      WHEN IS_ARRAY(data:value) OR IS_OBJECT(data:value) THEN NULL
+      WHEN TRY_TO_DOUBLE(data:value::STRING) IS NOT NULL THEN TRY_TO_DOUBLE(data:value::STRING)
+      ELSE NULL
+    END AS amount_usd,
+
+    COALESCE(
+      CASE
+        WHEN IS_ARRAY(data:gas:gas_used_amount) OR IS_OBJECT(data:gas:gas_used_amount)
+          OR IS_ARRAY(data:gas_price_rate:source_token.token_price.usd) OR IS_OBJECT(data:gas_price_rate:source_token.token_price.usd)
+        THEN NULL
+        WHEN TRY_TO_DOUBLE(data:gas:gas_used_amount::STRING) IS NOT NULL
+          AND TRY_TO_DOUBLE(data:gas_price_rate:source_token.token_price.usd::STRING) IS NOT NULL
+        THEN TRY_TO_DOUBLE(data:gas:gas_used_amount::STRING) * TRY_TO_DOUBLE(data:gas_price_rate:source_token.token_price.usd::STRING)
+        ELSE NULL
+      END,
+      CASE
+        WHEN IS_ARRAY(data:fees:express_fee_usd) OR IS_OBJECT(data:fees:express_fee_usd) THEN NULL
+        WHEN TRY_TO_DOUBLE(data:fees:express_fee_usd::STRING) IS NOT NULL THEN TRY_TO_DOUBLE(data:fees:express_fee_usd::STRING)
+        ELSE NULL
+      END
+    ) AS fee,
+
+    id,
+    'GMP' AS "Service",
+    data:symbol::STRING AS raw_asset
+
+  FROM axelar.axelscan.fact_gmp
+  WHERE status = 'executed'
+    AND simplified_status = 'received'
+"""
+
+SERVICE_SELECTS = {
+    "Token Transfers": TOKEN_TRANSFERS_SELECT,
+    "GMP": GMP_SELECT,
+}
+
+# --- Date Predicates --------------------------------------------------------------------------------------------------
+# Half-open range on the raw created_at column, appended to the WHERE clause of each service branch. Filtering the
+# bare column (no ::date cast) inside the branch lets the warehouse prune micro-partitions on created_at before any
+# VARIANT field is parsed. `end_date` is inclusive, like the page's date inputs.
+def created_at_range(start_date=None, end_date=None):
+    predicates = []
+    if start_date is not None:
+        predicates.append(f"    AND created_at >= '{start_date}'")
+    if end_date is not None:
+        predicates.append(f"    AND created_at < '{end_date + timedelta(days=1)}'")
+    return "\n".join(predicates)
+
+
+def service_branch(service_select, start_date=None, end_date=None):
+    return service_select + created_at_range(start_date, end_date)
+
+
+# --- Flattened Fact Rows ----------------------------------------------------------------------------------------------
+# Transfer-level rows of the unified fact set, used to fill the local day-partitioned store (see axelar.fact_store).
+# `since` limits the scan to rows created on or after that date, so a refresh only reads the days it is missing;
+# `end_date` (inclusive) closes the range for exports (see axelar.export).
+def fact_rows_query(service_select, since=None, end_date=None):
+    return f"""
+WITH axelar_service AS (
+{service_branch(service_select, since, end_date)}
+    )
+
+SELECT created_at as "created_at", id as "id", user as "user",
+     source_chain as "source_chain", destination_chain as "destination_chain", "Service" as "service",
+     amount as "amount", amount_usd as "amount_usd", fee as "fee",
+     raw_asset as "raw_asset"
+FROM axelar_service
+    """
+
+
+def fact_rows_queries(since=None, end_date=None):
+    return {
+        service: fact_rows_query(service_select, since, end_date)
+        for service, service_select in SERVICE_SELECTS.items()
+    }
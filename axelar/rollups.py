@@ -0,0 +1,155 @@
+import os
+import threading
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import streamlit as st
+
+from axelar import hll
+from axelar.frames import CATEGORY_COLUMNS, arrow_to_frame
+from axelar.sections import SKETCH_KEYS
+from axelar.tokens import symbols
+
+# --- Daily Rollups ----------------------------------------------------------------------------------------------------
+# One row per (day, source chain, destination chain, asset, service) with additive transfer counts, sums and
+# non-null counts, plus sparse HyperLogLog sketches of the users (see axelar.hll for the error bound). The sketches are
+# kept at the grain the page reads them, one per (day, service, section key) for each section (sections.SKETCH_KEYS),
+# since a sketch per fact row holds about as many registers as there are facts. Both are built from the local fact
+# store, one day at a time, and a date range is answered by merging its days.
+#
+# Transfers need no sketch: every transfer has its own id, so the daily distinct id counts already add up exactly.
+
+DEFAULT_ROOT = ".cache/axelar/rollups"
+SYNC_BATCH_DAYS = 31
+
+ROLLUP_KEYS = ["day", "source_chain", "destination_chain", "raw_asset", "service"]
+
+_KEY_FIELDS = [
+    ("day", pa.date32()),
+    ("source_chain", pa.string()),
+    ("destination_chain", pa.string()),
+    ("raw_asset", pa.string()),
+    ("service", pa.string()),
+]
+METRICS_SCHEMA = pa.schema(_KEY_FIELDS + [
+    ("transfers", pa.int64()),
+    ("volume_usd", pa.float64()),
+    ("volume_count", pa.int64()),
+    ("fees_usd", pa.float64()),
+    ("fee_count", pa.int64()),
+])
+SKETCH_KEY_COLUMNS = ["day", "section", "service", "key"]
+SKETCH_SCHEMA = pa.schema([
+    ("day", pa.date32()),
+    ("section", pa.string()),
+    ("service", pa.string()),
+    ("key", pa.string()),
+    ("register", pa.uint16()),
+    ("rank", pa.uint8()),
+])
+SKETCH_CATEGORY_COLUMNS = CATEGORY_COLUMNS + ("section", "key")
+
+
+def section_sketches(rows):
+    ranked = hll.ranks(rows, "user")
+    sketches = []
+    for section, key_fn in SKETCH_KEYS.items():
+        df, key = key_fn(ranked)
+        registers = pd.DataFrame({
+            "day": df["day"],
+            "section": section,
+            "service": df["service"].astype(object),
+            "key": key.astype(object),
+            "register": df["register"],
+            "rank": df["rank"],
+        })
+        sketches.append(hll.merge(registers, SKETCH_KEY_COLUMNS))
+    return pd.concat(sketches, ignore_index=True)
+
+
+def daily_rollup(rows):
+    rows = rows.assign(day=rows["created_at"].dt.date)
+    grouped = rows.groupby(ROLLUP_KEYS, sort=False, dropna=False, observed=True)
+    metrics = grouped.agg(
+        transfers=("id", "nunique"),
+        volume_usd=("amount_usd", "sum"),
+        volume_count=("amount_usd", "count"),
+        fees_usd=("fee", "sum"),
+        fee_count=("fee", "count"),
+    ).reset_index()
+    metrics["volume_usd"] = metrics["volume_usd"].where(metrics["volume_count"] > 0)
+    metrics["fees_usd"] = metrics["fees_usd"].where(metrics["fee_count"] > 0)
+    return metrics, section_sketches(rows)
+
+
+def _write_table(df, schema, path):
+    df = df.astype({col: object for col in CATEGORY_COLUMNS if col in df})
+    tmp_path = path.with_name(path.name + ".tmp")
+    pq.write_table(pa.Table.from_pandas(df, schema=schema, preserve_index=False), tmp_path)
+    os.replace(tmp_path, path)
+
+
+class RollupStore:
+    def __init__(self, root=DEFAULT_ROOT):
+        self.root = Path(root)
+        # the fact store watermark the rollups were last synced to; None until this process has synced once
+        self.watermark = None
+        self._lock = threading.Lock()
+
+    def _day_dir(self, day):
+        return self.root / f"day={day}"
+
+    def _built_at(self, day):
+        try:
+            return (self._day_dir(day) / "section_users.parquet").stat().st_mtime
+        except FileNotFoundError:
+            return None
+
+    # --- Build -----------------------------------------------------------------------------------------------------
+    # Rebuilds every day whose fact partition is newer than its rollup, so it picks up whatever a refresh rewrote.
+    # Stale days are rolled up SYNC_BATCH_DAYS at a time: one read and one group-by per batch rather than per day.
+    def sync(self, fact_store):
+        with self._lock:
+            stale = [
+                day for day in fact_store.days()
+                if (self._built_at(day) or 0) < fact_store.partition_mtime(day)
+            ]
+            for i in range(0, len(stale), SYNC_BATCH_DAYS):
+                batch = stale[i:i + SYNC_BATCH_DAYS]
+                rows = fact_store.read_rows(batch[0], batch[-1])
+                rows = rows[rows["created_at"].dt.date.isin(batch)]
+                metrics, users = daily_rollup(rows)
+                metrics_by_day = dict(tuple(metrics.groupby("day", sort=False)))
+                users_by_day = dict(tuple(users.groupby("day", sort=False)))
+                for day in batch:
+                    day_dir = self._day_dir(day)
+                    day_dir.mkdir(parents=True, exist_ok=True)
+                    _write_table(metrics_by_day.get(day, metrics.iloc[:0]), METRICS_SCHEMA, day_dir / "metrics.parquet")
+                    _write_table(users_by_day.get(day, users.iloc[:0]), SKETCH_SCHEMA, day_dir / "section_users.parquet")
+            self.watermark = fact_store.watermark
+
+    # --- Reads -----------------------------------------------------------------------------------------------------
+    def _read(self, name, schema, start_date, end_date, category_columns=CATEGORY_COLUMNS):
+        files = [
+            str(path)
+            for path in self.root.glob(f"day=*/{name}.parquet")
+            if start_date <= date.fromisoformat(path.parent.name[len("day="):]) <= end_date
+        ]
+        if not files:
+            return pd.DataFrame({field.name: pd.Series(dtype=field.type.to_pandas_dtype()) for field in schema})
+        return arrow_to_frame(ds.dataset(files, schema=schema, format="parquet").to_table(), category_columns)
+
+    def read(self, start_date, end_date):
+        metrics = self._read("metrics", METRICS_SCHEMA, start_date, end_date)
+        users = self._read("section_users", SKETCH_SCHEMA, start_date, end_date, SKETCH_CATEGORY_COLUMNS)
+        metrics["symbol"] = symbols(metrics["raw_asset"])
+        return metrics, users
+
+
+@st.cache_resource
+def get_rollup_store():
+    return RollupStore(os.environ.get("AXELAR_ROLLUP_STORE", DEFAULT_ROOT))
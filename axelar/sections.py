@@ -0,0 +1,303 @@
+import sys
+
+import numpy as np
+import pandas as pd
+
+from axelar import hll
+from axelar.frames import concat_frames
+from axelar.tokens import symbols
+
+FACT_KEYS = ["source_chain", "destination_chain", "raw_asset", "symbol", "service", "user"]
+
+
+# --- Transfer Facts from Rows -----------------------------------------------------------------------------------------
+# Transfer-level rows from the local fact store grouped by FACT_KEYS. Transfer counts, sums and non-null counts are
+# additive over this grain and the user column is kept, so every section table (including the distinct user / chain /
+# token counts) can be rebuilt exactly from the facts.
+def facts_from_rows(rows, keys=FACT_KEYS):
+    grouped = rows.groupby(keys, sort=False, dropna=False, observed=True)
+    facts = grouped.agg(
+        transfers=("id", "nunique"),
+        volume_usd=("amount_usd", "sum"),
+        volume_count=("amount_usd", "count"),
+        fees_usd=("fee", "sum"),
+        fee_count=("fee", "count"),
+    ).reset_index()
+    # SUM over only NULLs is NULL in the warehouse, not 0
+    facts["volume_usd"] = facts["volume_usd"].where(facts["volume_count"] > 0)
+    facts["fees_usd"] = facts["fees_usd"].where(facts["fee_count"] > 0)
+    return facts
+
+
+# Per-day facts, the unit the interval cache stores (see axelar.interval_cache)
+def daily_facts_from_rows(rows):
+    return facts_from_rows(rows.assign(day=rows["created_at"].dt.date), ["day"] + FACT_KEYS)
+
+
+# Collapses any set of facts frames (e.g. a run of cached days) back to the FACT_KEYS grain
+def merge_facts(frames):
+    grouped = concat_frames(frames).groupby(FACT_KEYS, sort=False, dropna=False, observed=True)
+    return pd.DataFrame({
+        "transfers": grouped["transfers"].sum(),
+        "volume_usd": grouped["volume_usd"].sum(min_count=1),
+        "volume_count": grouped["volume_count"].sum(),
+        "fees_usd": grouped["fees_usd"].sum(min_count=1),
+        "fee_count": grouped["fee_count"].sum(),
+    }).reset_index()
+
+
+# --- Sampled Facts ----------------------------------------------------------------------------------------------------
+# Facts built from the fact store's row sample (see axelar.fact_store) with the additive columns scaled up by 1 / rate,
+# for the page's preview mode. Averages come out unbiased; distinct counts are those of the sample (lower bounds).
+def scale_facts(facts, rate):
+    additive = ["transfers", "volume_usd", "volume_count", "fees_usd", "fee_count"]
+    return facts.assign(**{col: facts[col] / rate for col in additive})
+
+
+# Relative half-width of the 95% interval of a scaled count estimated from `sampled` sampled transfers
+def sample_error(sampled, rate):
+    return 1.96 * ((1 - rate) / sampled) ** 0.5 if sampled else float("inf")
+
+
+def preview_help(rate):
+    return {
+        "🚀Transfers": f"Estimated from a {rate:.0%} sample, scaled ×{1 / rate:.0f}.",
+        "👥Users": f"Users seen in the {rate:.0%} sample only, a lower bound.",
+        "💸Volume($)": f"Estimated from a {rate:.0%} sample, scaled ×{1 / rate:.0f}.",
+        "⛽Fees($)": f"Estimated from a {rate:.0%} sample, scaled ×{1 / rate:.0f}.",
+        "📋Txn/User": "Scaled transfers over sampled users; overstated in preview.",
+    }
+
+
+# --- Service Filter ---------------------------------------------------------------------------------------------------
+# Each section of the page can be narrowed to one service; "All" keeps both.
+
+SERVICE_FILTERS = ["All", "Token Transfers", "GMP"]
+
+
+def filter_service(facts, service):
+    if facts is None or service in (None, "All"):
+        return facts
+    return facts[facts["service"] == service]
+
+
+# --- Section Tables ---------------------------------------------------------------------------------------------------
+# Each table on the Cross-chain Transfers page is a group-by over the shared transfer facts (see facts_from_rows).
+# Column names and order match the tables the page has always shown.
+
+
+def _summarize(facts, key_fn, distinct_columns, sketches=None):
+    facts, key = key_fn(facts)
+    grouped = facts.groupby(key, sort=False, dropna=False, observed=True)
+
+    transfers = grouped["transfers"].sum()
+    if sketches is None:
+        users = grouped["user"].nunique()
+    else:
+        users = hll.estimate(sketches, sketches["key"].astype(object))
+        users = users.reindex(transfers.index.astype(object)).fillna(0).astype("int64").to_numpy()
+    volume = grouped["volume_usd"].sum(min_count=1)
+    fees = grouped["fees_usd"].sum(min_count=1)
+
+    df = pd.DataFrame({
+        "🚀Transfers": transfers,
+        "👥Users": users,
+        "💸Volume($)": volume.round(1),
+        "📊Avg Volume($)": (volume / grouped["volume_count"].sum()).round(1),
+        "⛽Fees($)": fees.round(1),
+        "💨Avg Fee($)": (fees / grouped["fee_count"].sum()).round(5),
+    })
+    for label, column in distinct_columns.items():
+        df[label] = grouped[column].nunique()
+
+    df = df.sort_values("🚀Transfers", ascending=False, kind="stable").rename_axis(key.name).reset_index()
+    df.index = pd.RangeIndex(1, len(df) + 1)
+    return df
+
+
+# --- Section Keys -----------------------------------------------------------------------------------------------------
+# Row filter + group key of each section. Applied to the facts here and, when the rollups are built, to the rows behind
+# each section's HLL user sketches (see SKETCH_KEYS).
+
+def _source_chain_key(df):
+    df = df[df["source_chain"].notna()]
+    return df, df["source_chain"].rename("📤Source Chain")
+
+
+def _destination_chain_key(df):
+    df = df[df["destination_chain"].notna()]
+    return df, df["destination_chain"].rename("📥Destination Chain")
+
+
+def _path_key(df):
+    df = df[df["destination_chain"].notna()]
+    path = df["source_chain"].astype(object) + "➡" + df["destination_chain"].astype(object)
+    return df, path.rename("🔀Path")
+
+
+def _token_key(df):
+    df = df[df["symbol"].notna()]
+    return df, df["symbol"].rename("💎Token")
+
+
+def _raw_asset_key(df):
+    df = df[df["raw_asset"].notna()]
+    return df, df["raw_asset"].rename("💎Token")
+
+
+# The rollups keep one set of user sketches per day for each section's keys (see axelar.rollups), so an estimate merges
+# only the registers of its own section. Tokens are sketched per raw asset and resolved to symbols when read, like the
+# facts: assets sharing a symbol merge the same way days do.
+SKETCH_KEYS = {
+    "source_chain": _source_chain_key,
+    "destination_chain": _destination_chain_key,
+    "path": _path_key,
+    "token": _raw_asset_key,
+}
+
+
+def _section_sketches(sketches, section):
+    if sketches is None:
+        return None
+    sketches = sketches[sketches["section"] == section]
+    if section == "token":
+        sketches = sketches.assign(key=symbols(sketches["key"]))
+    return sketches
+
+
+# --- Tables -----------------------------------------------------------------------------------------------------------
+# `sketches` switches the user counts from exact distinct counts over the facts to merged HyperLogLog estimates.
+
+# Header tooltips for the columns that are estimates when the tables are built from sketches
+APPROXIMATE_HELP = {
+    "👥Users": f"Approximate: ±{hll.STANDARD_ERROR:.1%} standard error (±{2 * hll.STANDARD_ERROR:.1%} at 95% confidence). "
+               "Turn off fast mode for exact counts.",
+    "📋Txn/User": "Based on the approximate user count.",
+}
+
+
+def table_help(sketches):
+    return None if sketches is None else APPROXIMATE_HELP
+
+
+def source_chain_table(facts, sketches=None):
+    return _summarize(facts, _source_chain_key, {
+        "📥#Dest Chains": "destination_chain",
+        "💎#Tokens": "raw_asset",
+    }, _section_sketches(sketches, "source_chain"))
+
+
+def destination_chain_table(facts, sketches=None):
+    return _summarize(facts, _destination_chain_key, {
+        "📤#Source Chains": "source_chain",
+        "💎#Tokens": "raw_asset",
+    }, _section_sketches(sketches, "destination_chain"))
+
+
+def path_table(facts, sketches=None):
+    df = _summarize(facts, _path_key, {"💎#Tokens": "raw_asset"}, _section_sketches(sketches, "path"))
+    users = df["👥Users"].where(df["👥Users"] > 0)
+    df.insert(7, "📋Txn/User", (df["🚀Transfers"] / users).round().astype("Int64"))
+    return df
+
+
+def token_table(facts, sketches=None):
+    return _summarize(facts, _token_key, {
+        "📤#Source Chains": "source_chain",
+        "📥#Destination Chains": "destination_chain",
+    }, _section_sketches(sketches, "token"))
+
+
+# --- Entity Drill-down -----------------------------------------------------------------------------------------------
+# Daily transfers / users / volume / fees of a single chain, path or token, for the row picked in a section table.
+# The index is built once per range and service from the per-day facts the page already holds (see
+# axelar.interval_cache): for each table key the facts are grouped to (entity, day) and sorted by entity into
+# contiguous NumPy columns, with each entity's [start, stop) offsets in a dict. A lookup is a dict hit and a slice of
+# each column (views, no copy), not a group-by or a query. Users are exact distinct users per day.
+
+DRILLDOWN_KEYS = {
+    "📤Source Chain": _source_chain_key,
+    "📥Destination Chain": _destination_chain_key,
+    "🔀Path": _path_key,
+    "💎Token": _token_key,
+}
+SERIES_COLUMNS = ["Date", "Transfers", "Users", "Volume ($)", "Fees ($)"]
+
+
+def _entity_series(daily_facts, key_fn):
+    facts, key = key_fn(daily_facts)
+    # day facts carry narrow integer counts (see axelar.frames); sum them as int64 so a busy entity cannot overflow
+    facts = facts.assign(transfers=facts["transfers"].astype("int64"))
+    grouped = facts.groupby([key, pd.to_datetime(facts["day"]).rename("Date")], sort=True, observed=True)
+    series = pd.DataFrame({
+        "Transfers": grouped["transfers"].sum(),
+        "Users": grouped["user"].nunique(),
+        "Volume ($)": grouped["volume_usd"].sum(min_count=1),
+        "Fees ($)": grouped["fees_usd"].sum(min_count=1),
+    }).reset_index(level="Date")
+    entities, starts, counts = np.unique(series.index.to_numpy(dtype=object), return_index=True, return_counts=True)
+    offsets = {entity: (start, start + count) for entity, start, count in zip(entities, starts, counts)}
+    return offsets, {column: series[column].to_numpy() for column in SERIES_COLUMNS}
+
+
+class EntitySeriesIndex:
+    def __init__(self, daily_facts, key_fns=DRILLDOWN_KEYS):
+        self._offsets = {}
+        self._columns = {}
+        if daily_facts.empty:
+            daily_facts = pd.DataFrame(columns=["day", "transfers", "volume_usd", "fees_usd"] + FACT_KEYS)
+        for dimension, key_fn in key_fns.items():
+            self._offsets[dimension], self._columns[dimension] = _entity_series(daily_facts, key_fn)
+
+    # Memory held, for the byte budget of the shared results store (see axelar.cache.value_bytes)
+    @property
+    def nbytes(self):
+        arrays = sum(values.nbytes for columns in self._columns.values() for values in columns.values())
+        offsets = sum(
+            sys.getsizeof(offsets) + sum(sys.getsizeof(entity) + sys.getsizeof(span) for entity, span in offsets.items())
+            for offsets in self._offsets.values()
+        )
+        return arrays + offsets
+
+    def series(self, dimension, entity):
+        start, stop = self._offsets[dimension].get(entity, (0, 0))
+        return pd.DataFrame({column: values[start:stop] for column, values in self._columns[dimension].items()})
+
+
+# --- Path Table Pages -------------------------------------------------------------------------------------------------
+# The path table has up to (#chains)^2 rows, so the page shows it a page at a time instead of shipping every row to the
+# browser. Pages use keyset pagination: rows are ordered by `sort_column` (descending, blanks last) and then by the key
+# column, and a page is the `k` rows after the (value, key) cursor of the previous one. The order is computed once per
+# table and sort column (keyset_order; the page shares it like the tables), and each page is a slice of it.
+
+def keyset_order(df, sort_column):
+    key = df.columns[0]
+    return df.sort_values([sort_column, key], ascending=[False, True], na_position="last", kind="stable")
+
+
+def keyset_page(ordered, sort_column, k, after=None):
+    key = ordered.columns[0]
+    start = 0
+    if after is not None:
+        value, last_key = after
+        values, keys = ordered[sort_column], ordered[key]
+        if pd.isna(value):
+            after_cursor = values.isna() & (keys > last_key)
+        else:
+            after_cursor = ((values < value) | ((values == value) & (keys > last_key))).fillna(False).astype(bool)
+            after_cursor |= values.isna()
+        # the rows after the cursor are a suffix of the order
+        start = len(ordered) - int(after_cursor.sum())
+    page = ordered.iloc[start:start + k]
+    cursor = (page[sort_column].iloc[-1], page[key].iloc[-1]) if len(ordered) > start + k else None
+    return page, cursor
+
+
+# Row holding the maximum of each column, from a single argmax pass over just those columns (the KPI "top by X" values);
+# an empty frame has no leaders
+def leaders(df, columns):
+    if df.empty:
+        return {}
+    values = df[columns].astype("float64").to_numpy()
+    positions = np.where(np.isnan(values), -np.inf, values).argmax(axis=0)
+    return {column: df.iloc[position] for column, position in zip(columns, positions)}
@@ -0,0 +1,63 @@
+import os
+import threading
+
+import pandas as pd
+import streamlit as st
+
+from axelar.cache import BoundedCache
+from axelar.telemetry import telemetry
+
+# --- Shared Results ---------------------------------------------------------------------------------------------------
+# One process-wide store of computed frames (merged facts, section tables, Satellite buckets) keyed by what they were
+# computed from, typically (name, start, end, data version, ...). Every session viewing the same range reads the same
+# objects instead of building its own copy, and concurrent first requests for a key compute it once.
+#
+# Frames handed out are shared, so they must not be modified in place; under pandas copy-on-write (always on from pandas
+# 3, switched on here for older versions) filters, column selections and re-indexing are views, and any write a session
+# makes lands in its own copy, never in the shared frame. String columns are Arrow-backed and name columns categorical,
+# so the frames are mostly columnar buffers already.
+
+DEFAULT_MAX_BYTES = int(os.environ.get("AXELAR_SHARED_MB", 256)) * 2 ** 20
+
+if int(pd.__version__.split(".")[0]) < 3:
+    pd.set_option("mode.copy_on_write", True)
+
+
+class SharedResults:
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self._results = BoundedCache(max_bytes)
+        self._computing = {}
+        self._lock = threading.Lock()
+
+    # A key of None means "not shareable" (e.g. a preview): the value is computed and not stored
+    def get(self, key, compute):
+        if key is None:
+            return compute()
+        value = self._results.get(key)
+        if value is not None:
+            return value
+        with self._lock:
+            key_lock = self._computing.setdefault(key, threading.Lock())
+        with key_lock:
+            # whoever held the lock first has stored it by now
+            value = self._results.peek(key)
+            if value is None:
+                value = compute()
+                self._results.put(key, value)
+        with self._lock:
+            self._computing.pop(key, None)
+        return value
+
+    def stats(self):
+        return self._results.stats()
+
+
+def result_key(base, *parts):
+    return None if base is None else base + parts
+
+
+@st.cache_resource
+def get_shared_results():
+    shared = SharedResults()
+    telemetry.register_cache("shared_results", shared)
+    return shared
@@ -0,0 +1,128 @@
+import argparse
+import sys
+from datetime import timedelta
+
+import streamlit as st
+
+from axelar.connection import get_connection_pool
+from axelar.fact_store import REFRESH_LOOKBACK_DAYS
+from axelar.queries import SERVICE_SELECTS, created_at_range, service_branch
+from axelar.tokens import symbol_sql
+
+# --- Typed Staging Table ----------------------------------------------------------------------------------------------
+# A narrow, typed copy of the unified Token Transfers + GMP rows, so the VARIANT parsing (IS_ARRAY / IS_OBJECT /
+# TRY_TO_DOUBLE on every amount, price and fee path) runs once per row at load time instead of on every dashboard
+# query. Clustered on the created_at day, so the dashboard's date predicates prune it like the source tables.
+#
+# Maintained by this module's CLI, e.g. from a scheduled task:
+#
+#     python -m axelar.staging                  # create if missing, then merge the recent days (see --lookback-days)
+#     python -m axelar.staging --full-refresh   # rebuild from all history
+#
+# The dashboard reads it instead of the fact tables when `staging_table` is set in the [snowflake] secrets. The symbol
+# column is materialized from axelar.tokens for other consumers; the dashboard still resolves symbols from raw_asset,
+# so a token added there applies without a rebuild.
+
+DEFAULT_TABLE = "axelar_service_rows"
+
+STAGING_COLUMNS = """
+    created_at TIMESTAMP_NTZ,
+    id STRING,
+    user STRING,
+    source_chain STRING,
+    destination_chain STRING,
+    service STRING,
+    amount DOUBLE,
+    amount_usd DOUBLE,
+    fee DOUBLE,
+    raw_asset STRING,
+    symbol STRING
+"""
+
+
+def flattened_rows_query(since=None):
+    branches = "\n  UNION ALL\n".join(service_branch(select, since) for select in SERVICE_SELECTS.values())
+    return f"""
+WITH axelar_service AS (
+{branches}
+    )
+
+SELECT created_at, id, user, source_chain, destination_chain, "Service" AS service,
+     amount, amount_usd, fee, raw_asset, {symbol_sql("raw_asset")} AS symbol
+FROM axelar_service
+    """
+
+
+def create_table_sql(table):
+    return f"CREATE TABLE IF NOT EXISTS {table} ({STAGING_COLUMNS}) CLUSTER BY (TO_DATE(created_at))"
+
+
+def rebuild_table_sql(table):
+    return f"CREATE OR REPLACE TABLE {table} ({STAGING_COLUMNS}) CLUSTER BY (TO_DATE(created_at)) AS {flattened_rows_query()}"
+
+
+def merge_sql(table, since):
+    return f"""
+MERGE INTO {table} t
+USING ({flattened_rows_query(since)}) s
+  ON t.service = s.service AND t.id = s.id
+WHEN MATCHED THEN UPDATE SET
+  created_at = s.created_at, user = s.user, source_chain = s.source_chain, destination_chain = s.destination_chain,
+  amount = s.amount, amount_usd = s.amount_usd, fee = s.fee, raw_asset = s.raw_asset, symbol = s.symbol
+WHEN NOT MATCHED THEN INSERT
+  (created_at, id, user, source_chain, destination_chain, service, amount, amount_usd, fee, raw_asset, symbol)
+  VALUES (s.created_at, s.id, s.user, s.source_chain, s.destination_chain, s.service, s.amount, s.amount_usd, s.fee,
+          s.raw_asset, s.symbol)
+    """
+
+
+# The same columns and aliases as axelar.queries.fact_rows_query, so the fact store can't tell the two apart
+def staging_rows_query(table, since=None, end_date=None):
+    return f"""
+SELECT created_at as "created_at", id as "id", user as "user",
+     source_chain as "source_chain", destination_chain as "destination_chain", service as "service",
+     amount as "amount", amount_usd as "amount_usd", fee as "fee",
+     raw_asset as "raw_asset"
+FROM {table}
+WHERE TRUE
+{created_at_range(since, end_date)}
+    """
+
+
+# A merge re-reads the last `lookback_days` before the newest row, the same window as the local fact store, so late
+# executions are picked up
+def refresh(conn, table, full_refresh=False, lookback_days=REFRESH_LOOKBACK_DAYS):
+    cursor = conn.cursor()
+    try:
+        if full_refresh:
+            cursor.execute(rebuild_table_sql(table))
+            return None
+        cursor.execute(create_table_sql(table))
+        latest = cursor.execute(f"SELECT MAX(created_at) FROM {table}").fetchone()[0]
+        if latest is None:
+            cursor.execute(f"INSERT INTO {table} {flattened_rows_query()}")
+            return None
+        since = latest.date() - timedelta(days=lookback_days)
+        cursor.execute(merge_sql(table, since))
+        return since
+    finally:
+        cursor.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Create or incrementally refresh the typed staging table.")
+    parser.add_argument("--table", help=f"table name (default: staging_table from the secrets, else {DEFAULT_TABLE})")
+    parser.add_argument("--full-refresh", action="store_true", help="rebuild the table from all history")
+    parser.add_argument("--lookback-days", type=int, default=REFRESH_LOOKBACK_DAYS,
+                        help=f"days before the newest row to merge again (default: {REFRESH_LOOKBACK_DAYS})")
+    args = parser.parse_args(argv)
+
+    table = args.table or st.secrets["snowflake"].get("staging_table", DEFAULT_TABLE)
+    with get_connection_pool().connection() as conn:
+        since = refresh(conn, table, args.full_refresh, args.lookback_days)
+    print(f"{table}: {'rebuilt from all history' if since is None else f'merged rows created since {since}'}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
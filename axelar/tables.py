@@ -0,0 +1,62 @@
+import io
+
+import pandas as pd
+import streamlit as st
+
+# --- Section Table Rendering ------------------------------------------------------------------------------------------
+# Tables are handed to st.dataframe with their numeric dtypes intact and a per-column display format, so nothing is
+# copied or turned into strings, and sorting in the browser stays numeric. Formats are sprintf-js specifiers. `help`
+# adds header tooltips, e.g. the expected error of approximate columns. With a `key`, a single row can be selected and
+# the selection event is returned (the page's drill-down).
+
+DEFAULT_FORMAT = "%,.0f"
+COLUMN_FORMATS = {
+    "💨Avg Fee($)": "%,.3f",
+}
+
+
+def column_config(df, formats=COLUMN_FORMATS, help=None):
+    help = help or {}
+    return {
+        col: st.column_config.NumberColumn(format=formats.get(col, DEFAULT_FORMAT), help=help.get(col))
+        for col in df.columns
+        if pd.api.types.is_numeric_dtype(df[col])
+    }
+
+
+def render_table(df, height=400, help=None, key=None):
+    if key is None:
+        return st.dataframe(df, height=height, column_config=column_config(df, help=help))
+    return st.dataframe(
+        df, height=height, column_config=column_config(df, help=help), key=key, on_select="rerun",
+        selection_mode="single-row",
+    )
+
+
+# --- Table Downloads --------------------------------------------------------------------------------------------------
+# The whole table behind a section (every row, not just the page shown) as CSV or Parquet. The files are built only
+# when a button is clicked, and clicking does not rerun the page. Transfer-level rows are too large for a browser
+# download; see axelar.export.
+def _csv_bytes(df):
+    return df.to_csv(index=False).encode()
+
+
+def _parquet_bytes(df):
+    buffer = io.BytesIO()
+    df.to_parquet(buffer, index=False)
+    return buffer.getvalue()
+
+
+def render_downloads(df, file_stem, key):
+    file_stem = file_stem.replace(" ", "_").lower()
+    col_csv, col_parquet, _ = st.columns([1, 1, 4])
+    with col_csv:
+        st.download_button(
+            "⬇ CSV", lambda: _csv_bytes(df), file_name=f"{file_stem}.csv", mime="text/csv",
+            key=f"{key}_csv", on_click="ignore",
+        )
+    with col_parquet:
+        st.download_button(
+            "⬇ Parquet", lambda: _parquet_bytes(df), file_name=f"{file_stem}.parquet",
+            mime="application/vnd.apache.parquet", key=f"{key}_parquet", on_click="ignore",
+        )
@@ -0,0 +1,135 @@
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque, defaultdict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pandas as pd
+import streamlit as st
+
+# --- Query Telemetry --------------------------------------------------------------------------------------------------
+# One record per loader call: the warehouse query id, time queued, executing and fetching, bytes scanned, rows
+# returned, and whether the result came from the app cache. Records go three ways:
+#   - the "axelar.telemetry" logger, one JSON object per line;
+#   - a bounded in-process history shown by the sidebar diagnostics panel;
+#   - running totals exposed in Prometheus text format, over HTTP when AXELAR_METRICS_PORT is set.
+# Process-wide (a module-level instance, not st.cache_resource) because the background refresh thread records too.
+
+HISTORY_SIZE = 500
+RECORD_FIELDS = [
+    "at", "loader", "query", "query_id", "queued_s", "execution_s", "fetch_s", "rows", "bytes_scanned", "cache_hit",
+]
+CACHE_COUNTERS = ["hits", "misses", "evictions", "expirations", "invalidations"]
+
+logger = logging.getLogger("axelar.telemetry")
+if os.environ.get("AXELAR_TELEMETRY_LOG", "1") != "0" and not logger.handlers:
+    # JSON lines on stderr, whatever the root logger is configured to; set AXELAR_TELEMETRY_LOG=0 to silence
+    _handler = logging.StreamHandler()
+    _handler.setFormatter(logging.Formatter("%(message)s"))
+    logger.addHandler(_handler)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+
+
+class Telemetry:
+    def __init__(self, history_size=HISTORY_SIZE):
+        self._history = deque(maxlen=history_size)
+        self._totals = defaultdict(float)
+        self._caches = {}
+        self._lock = threading.Lock()
+
+    def record(self, loader, **fields):
+        record = {field: None for field in RECORD_FIELDS}
+        record.update(fields, at=time.time(), loader=loader)
+        with self._lock:
+            self._history.append(record)
+            labels = (loader, bool(record["cache_hit"]))
+            self._totals["calls", labels] += 1
+            for phase in ("queued", "execution", "fetch"):
+                self._totals[f"{phase}_seconds", labels] += record[f"{phase}_s"] or 0
+            self._totals["rows", labels] += record["rows"] or 0
+            self._totals["bytes_scanned", labels] += record["bytes_scanned"] or 0
+        logger.info(json.dumps(record, default=str))
+        return record
+
+    def register_cache(self, name, cache):
+        with self._lock:
+            self._caches[name] = cache
+
+    def history(self):
+        with self._lock:
+            return pd.DataFrame(list(self._history), columns=RECORD_FIELDS)
+
+    def cache_stats(self):
+        with self._lock:
+            caches = dict(self._caches)
+        return {name: cache.stats() for name, cache in caches.items()}
+
+    def prometheus_text(self):
+        with self._lock:
+            totals = dict(self._totals)
+        lines = []
+        for metric, kind in [
+            ("calls", "counter"), ("queued_seconds", "counter"), ("execution_seconds", "counter"),
+            ("fetch_seconds", "counter"), ("rows", "counter"), ("bytes_scanned", "counter"),
+        ]:
+            name = f"axelar_loader_{metric}_total"
+            lines.append(f"# TYPE {name} {kind}")
+            for (m, (loader, cache_hit)), value in sorted(totals.items()):
+                if m == metric:
+                    lines.append(f'{name}{{loader="{loader}",cache_hit="{str(cache_hit).lower()}"}} {value:g}')
+        stats = self.cache_stats()
+        for counter in CACHE_COUNTERS:
+            lines.append(f"# TYPE axelar_cache_{counter}_total counter")
+            lines += [f'axelar_cache_{counter}_total{{cache="{c}"}} {s[counter]}' for c, s in stats.items()]
+        for gauge in ("entries", "bytes", "max_bytes"):
+            lines.append(f"# TYPE axelar_cache_{gauge} gauge")
+            lines += [f'axelar_cache_{gauge}{{cache="{c}"}} {s[gauge]}' for c, s in stats.items()]
+        return "\n".join(lines) + "\n"
+
+
+telemetry = Telemetry()
+
+
+# --- Prometheus Endpoint ----------------------------------------------------------------------------------------------
+# Streamlit cannot add routes to its own server, so the text format is served from a small side server on
+# AXELAR_METRICS_PORT (any path). Started once per process; a no-op when the variable is unset.
+
+_metrics_server = None
+_metrics_lock = threading.Lock()
+
+
+class _MetricsHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        body = telemetry.prometheus_text().encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "text/plain; version=0.0.4")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def start_metrics_server(port=None):
+    global _metrics_server
+    port = port or os.environ.get("AXELAR_METRICS_PORT")
+    with _metrics_lock:
+        if port and _metrics_server is None:
+            _metrics_server = ThreadingHTTPServer(("", int(port)), _MetricsHandler)
+            threading.Thread(target=_metrics_server.serve_forever, name="axelar-metrics", daemon=True).start()
+    return _metrics_server
+
+
+# --- Sidebar Diagnostics Panel ----------------------------------------------------------------------------------------
+def render_diagnostics_panel():
+    if not st.sidebar.toggle("🩺Diagnostics"):
+        return
+    history = telemetry.history().iloc[::-1].assign(at=lambda df: pd.to_datetime(df["at"], unit="s"))
+    st.sidebar.caption("Recent loader calls (newest first)")
+    st.sidebar.dataframe(history, hide_index=True)
+    st.sidebar.caption("App caches")
+    st.sidebar.dataframe(pd.DataFrame(telemetry.cache_stats()).T)
@@ -0,0 +1,70 @@
+import pandas as pd
+
+from axelar.frames import concat_frames
+
+# --- Satellite Time Series --------------------------------------------------------------------------------------------
+# The Satellite page charts Token Transfers (the deposit-address transfers Satellite makes) over time. Its data is the
+# same per-day facts the Cross-chain Transfers page caches (see axelar.interval_cache), reduced once per date range to
+# daily buckets at the (day, source chain, user) grain. Week and month views are rolled up from those buckets in memory,
+# so switching the timeframe is a group-by, not a new query. The user column is kept in the buckets, which keeps the
+# weekly and monthly user counts exact.
+
+SATELLITE_SERVICE = "Token Transfers"
+TIMEFRAMES = ["month", "week", "day"]
+BUCKET_KEYS = ["day", "source_chain", "user"]
+TOP_SOURCE_CHAINS = 10
+
+
+# Buckets of a range without transfers, typed like real ones so the roll-ups work on them
+def empty_buckets():
+    return pd.DataFrame({
+        "day": pd.Series(dtype="datetime64[ns]"),
+        "source_chain": pd.Series(dtype="category"),
+        "user": pd.Series(dtype="str"),
+        "transfers": pd.Series(dtype="int64"),
+        "volume_usd": pd.Series(dtype="float64"),
+        "fees_usd": pd.Series(dtype="float64"),
+    })
+
+
+def daily_buckets(pieces, service=SATELLITE_SERVICE):
+    facts = concat_frames(pieces)
+    if facts.empty:
+        return empty_buckets()
+    facts = facts[facts["service"] == service]
+    grouped = facts.groupby(BUCKET_KEYS, sort=False, dropna=False, observed=True)
+    return pd.DataFrame({
+        "transfers": grouped["transfers"].sum(),
+        "volume_usd": grouped["volume_usd"].sum(min_count=1),
+        "fees_usd": grouped["fees_usd"].sum(min_count=1),
+    }).reset_index()
+
+
+# Start of the week (Monday, like Snowflake's DATE_TRUNC) or month of each day; computed once per distinct day
+def period_starts(days, timeframe):
+    distinct = pd.to_datetime(pd.Series(days.unique()))
+    if timeframe == "month":
+        starts = distinct.dt.to_period("M").dt.start_time
+    elif timeframe == "week":
+        starts = distinct - pd.to_timedelta(distinct.dt.weekday, unit="D")
+    else:
+        starts = distinct
+    return days.map(dict(zip(days.unique(), starts))).astype("datetime64[ns]")
+
+
+def roll_up(buckets, timeframe):
+    grouped = buckets.groupby(period_starts(buckets["day"], timeframe).rename("Date"), sort=True)
+    return pd.DataFrame({
+        "Transfers": grouped["transfers"].sum(),
+        "Users": grouped["user"].nunique(),
+        "Volume ($)": grouped["volume_usd"].sum(min_count=1).round(1),
+        "Fees ($)": grouped["fees_usd"].sum(min_count=1).round(1),
+    }).reset_index()
+
+
+# Transfers per period for the largest source chains over the whole range; the rest are folded into "other"
+def roll_up_by_source_chain(buckets, timeframe, top=TOP_SOURCE_CHAINS):
+    totals = buckets.groupby("source_chain", observed=True)["transfers"].sum().nlargest(top)
+    chain = buckets["source_chain"].astype(object).where(buckets["source_chain"].isin(totals.index), "other")
+    grouped = buckets.groupby([period_starts(buckets["day"], timeframe).rename("Date"), chain.rename("Source Chain")])
+    return grouped["transfers"].sum().rename("Transfers").reset_index()
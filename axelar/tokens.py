@@ -0,0 +1,106 @@
+import numpy as np
+import pandas as pd
+
+# --- Token Symbol Dimension -------------------------------------------------------------------------------------------
+# Maps the raw asset of a transfer (data:link:asset for Token Transfers, data:symbol for GMP) to the symbol shown in the
+# Tokens section. Applied in pandas on the categorical raw_asset column, so only the distinct assets are looked up, and
+# kept out of the warehouse SQL and the on-disk stores: adding a token here applies to all history without a refetch.
+# Assets that match nothing are shown as they are.
+
+ASSET_SYMBOLS = {
+    "arb-wei": "ARB",
+    "avalanche-uusdc": "Avalanche USDC",
+    "avax-wei": "AVAX",
+    "bnb-wei": "BNB",
+    "busd-wei": "BUSD",
+    "cbeth-wei": "cbETH",
+    "cusd-wei": "cUSD",
+    "dai-wei": "DAI",
+    "dot-planck": "DOT",
+    "eeur": "EURC",
+    "ern-wei": "ERN",
+    "eth-wei": "ETH",
+    "fil-wei": "FIL",
+    "frax-wei": "FRAX",
+    "ftm-wei": "FTM",
+    "glmr-wei": "GLMR",
+    "hzn-wei": "HZN",
+    "link-wei": "LINK",
+    "matic-wei": "MATIC",
+    "mkr-wei": "MKR",
+    "mpx-wei": "MPX",
+    "oath-wei": "OATH",
+    "op-wei": "OP",
+    "orbs-wei": "ORBS",
+    "factory/sei10hud5e5er4aul2l7sp2u9qp2lag5u4xf8mvyx38cnjvqhlgsrcls5qn5ke/seilor": "SEILOR",
+    "pepe-wei": "PEPE",
+    "polygon-uusdc": "Polygon USDC",
+    "reth-wei": "rETH",
+    "ring-wei": "RING",
+    "shib-wei": "SHIB",
+    "sonne-wei": "SONNE",
+    "stuatom": "stATOM",
+    "uatom": "ATOM",
+    "uaxl": "AXL",
+    "ukuji": "KUJI",
+    "ulava": "LAVA",
+    "uluna": "LUNA",
+    "ungm": "NGM",
+    "uni-wei": "UNI",
+    "uosmo": "OSMO",
+    "usomm": "SOMM",
+    "ustrd": "STRD",
+    "utia": "TIA",
+    "uumee": "UMEE",
+    "uusd": "USTC",
+    "uusdc": "USDC",
+    "uusdt": "USDT",
+    "vela-wei": "VELA",
+    "wavax-wei": "WAVAX",
+    "wbnb-wei": "WBNB",
+    "wbtc-satoshi": "WBTC",
+    "weth-wei": "WETH",
+    "wfil-wei": "WFIL",
+    "wftm-wei": "WFTM",
+    "wglmr-wei": "WGLMR",
+    "wmai-wei": "WMAI",
+    "wmatic-wei": "WMATIC",
+    "wsteth-wei": "wstETH",
+    "yield-eth-wei": "yieldETH",
+}
+
+# Case-insensitive prefixes, checked after the exact matches
+ASSET_SYMBOL_PREFIXES = {
+    "factory/sei10hub": "SEILOR",
+}
+
+
+def asset_symbol(raw_asset):
+    if raw_asset in ASSET_SYMBOLS:
+        return ASSET_SYMBOLS[raw_asset]
+    for prefix, symbol in ASSET_SYMBOL_PREFIXES.items():
+        if raw_asset.lower().startswith(prefix):
+            return symbol
+    return raw_asset
+
+
+def symbols(raw_assets):
+    raw_assets = raw_assets.astype("category")
+    codes, categories = pd.factorize(raw_assets.cat.categories.map(asset_symbol))
+    raw_codes = raw_assets.cat.codes.to_numpy()
+    symbol_codes = np.where(raw_codes >= 0, codes.take(raw_codes), -1) if len(codes) else raw_codes
+    return pd.Series(pd.Categorical.from_codes(symbol_codes, categories=categories), index=raw_assets.index, name="symbol")
+
+
+def _sql_string(value):
+    return "'" + value.replace("'", "''") + "'"
+
+
+def symbol_sql(column):
+    # the same lookup as asset_symbol, as a SQL expression, for tables that materialize the symbol (axelar.staging)
+    exact = "\n".join(f"    WHEN {column} = {_sql_string(a)} THEN {_sql_string(s)}" for a, s in ASSET_SYMBOLS.items())
+    prefixes = "\n".join(
+        f"    WHEN STARTSWITH(LOWER({column}), {_sql_string(p)}) THEN {_sql_string(s)}"
+        for p, s in ASSET_SYMBOL_PREFIXES.items()
+    )
+    return f"CASE\n{exact}\n{prefixes}\n    ELSE {column}\n  END"
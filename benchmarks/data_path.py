@@ -0,0 +1,196 @@
+import argparse
+import json
+import platform
+import resource
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import date
+from pathlib import Path
+
+import pandas as pd
+import pyarrow as pa
+
+from axelar import sections, tables
+from axelar.backends import DuckDBBackend
+from axelar.fact_store import FactStore
+from axelar.fixtures import write_fixtures
+from axelar.interval_cache import IntervalCache
+from axelar.rollups import RollupStore
+
+# --- Data Path Benchmarks ---------------------------------------------------------------------------------------------
+# Drives each stage of the Cross-chain Transfers pipeline over synthetic fact tables (axelar.fixtures) through the
+# DuckDB backend, and reports wall time, peak traced memory and rows/s per stage and dataset size.
+#
+#     python -m benchmarks.data_path --sizes 10000 100000 1000000
+#     python -m benchmarks.data_path --sizes 100000 --save benchmarks/baselines/local.json
+#     python -m benchmarks.data_path --sizes 100000 --compare benchmarks/baselines/local.json
+#
+# Each stage runs twice: once untraced for the wall time and rows/s, then once under tracemalloc for peak memory, since
+# tracing slows allocation-heavy stages several-fold. Stages that change state (store refresh, rollup sync, a cold
+# interval cache) are reset before each run. Peak memory is what tracemalloc sees (Python objects, numpy and pandas
+# buffers); DuckDB's and Arrow's own allocators are not traced, so the process max RSS is printed alongside. With --compare, any stage whose time grows by more than
+# --threshold against the baseline is reported and the run exits non-zero.
+#
+# The section stages run on the facts of the page's exact path: per-day facts loaded through the interval cache
+# (cold, then warm) and merged. `facts` times the all-rows group-by the page only uses for its sampled preview.
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+DEFAULT_THRESHOLD = 0.2
+FIXTURE_DAYS = 600
+FIXTURE_START = date(2024, 1, 1)
+
+SECTION_TABLES = [
+    sections.source_chain_table,
+    sections.destination_chain_table,
+    sections.path_table,
+    sections.token_table,
+]
+
+
+# `rows` is a count, or a function of the stage's result (e.g. len) for stages whose output size is not known up front.
+# `reset` puts back the state the stage starts from, before each of its two runs.
+def measure(results, size, stage, rows, fn, reset=None):
+    if reset:
+        reset()
+    started = time.perf_counter()
+    value = fn()
+    seconds = time.perf_counter() - started
+
+    if reset:
+        reset()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    if callable(rows):
+        rows = rows(value)
+    results.append({
+        "size": size,
+        "stage": stage,
+        "rows": rows,
+        "seconds": seconds,
+        "peak_mb": peak / 2 ** 20,
+        "rows_per_s": rows / seconds if seconds else float("inf"),
+    })
+    return value
+
+
+# --- Page Stages --------------------------------------------------------------------------------------------------
+# The KPI and render steps the page performs on each section table.
+
+def kpis(df):
+    return sections.leaders(df, [col for col in df.columns[1:] if pd.api.types.is_numeric_dtype(df[col])])
+
+
+def render(df):
+    # st.dataframe ships the frame to the browser as Arrow IPC; display formats travel as column config
+    tables.column_config(df)
+    sink = pa.BufferOutputStream()
+    table = pa.Table.from_pandas(df)
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().size
+
+
+def run_size(size, workdir, results):
+    root = Path(workdir) / str(size)
+    write_fixtures(root / "fixtures", size, start=str(FIXTURE_START), days=FIXTURE_DAYS)
+    backend = DuckDBBackend(root / "fixtures")
+    store = FactStore(root / "fact_rows")
+    rollups = RollupStore(root / "rollups")
+    end = date.fromordinal(FIXTURE_START.toordinal() + FIXTURE_DAYS)
+
+    fetched = measure(results, size, "fetch", size, lambda: backend.fetch_fact_rows())
+    measure(results, size, "store_refresh", len(fetched), lambda: store.refresh(backend),
+            reset=lambda: shutil.rmtree(store.root, ignore_errors=True))
+    del fetched
+    rows = measure(results, size, "store_read", len, lambda: store.read_rows(FIXTURE_START, end))
+    measure(results, size, "facts", len(rows), lambda: sections.facts_from_rows(rows))
+    measure(results, size, "rollup_sync", len(rows), lambda: rollups.sync(store),
+            reset=lambda: shutil.rmtree(rollups.root, ignore_errors=True))
+    del rows
+
+    # the page's exact path, as in axelar.prewarm.Refresher.load_daily_facts
+    load_daily_facts = lambda start, stop: sections.daily_facts_from_rows(store.read_rows(start, stop))
+    pieces_rows = lambda pieces: sum(len(piece) for piece in pieces)
+    measure(
+        results, size, "interval_cache", pieces_rows,
+        lambda: IntervalCache("benchmark").get(FIXTURE_START, end, load_daily_facts)
+    )
+    facts_cache = IntervalCache("benchmark")
+    facts_cache.get(FIXTURE_START, end, load_daily_facts)
+    pieces = measure(
+        results, size, "interval_cache_warm", pieces_rows, lambda: facts_cache.get(FIXTURE_START, end, load_daily_facts)
+    )
+    facts = measure(results, size, "merge", pieces_rows(pieces), lambda: sections.merge_facts(pieces))
+    del pieces
+
+    section_tables = measure(results, size, "sections", len(facts), lambda: [table(facts) for table in SECTION_TABLES])
+    metrics, users = measure(
+        results, size, "rollup_read", lambda read: len(read[0]) + len(read[1]), lambda: rollups.read(FIXTURE_START, end)
+    )
+    measure(results, size, "sections_rollups", len(metrics), lambda: [table(metrics, users) for table in SECTION_TABLES])
+
+    table_rows = sum(len(df) for df in section_tables)
+    measure(results, size, "kpis", table_rows, lambda: [kpis(df) for df in section_tables])
+    measure(results, size, "render", table_rows, lambda: [render(df) for df in section_tables])
+
+
+# --- Baselines ----------------------------------------------------------------------------------------------------
+
+def compare(results, baseline, threshold):
+    previous = {(r["size"], r["stage"]): r for r in baseline["results"]}
+    regressions = []
+    for r in results:
+        before = previous.get((r["size"], r["stage"]))
+        if before is None or not before["seconds"]:
+            continue
+        change = r["seconds"] / before["seconds"] - 1
+        r["change"] = change
+        if change > threshold:
+            regressions.append(r)
+    return regressions
+
+
+def print_report(results):
+    df = pd.DataFrame(results)
+    columns = ["size", "stage", "rows", "seconds", "peak_mb", "rows_per_s"] + (["change"] if "change" in df else [])
+    print(df[columns].to_string(index=False, float_format=lambda x: f"{x:,.3f}"))
+    print(f"max RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:,.0f} MB")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark the Cross-chain Transfers data path.")
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--workdir", help="where fixtures and stores are written (default: a temporary directory)")
+    parser.add_argument("--save", help="write the results as a baseline JSON file")
+    parser.add_argument("--compare", help="baseline JSON file to compare against")
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD)
+    args = parser.parse_args(argv)
+
+    results = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            run_size(size, args.workdir or tmp, results)
+
+    regressions = []
+    if args.compare:
+        with open(args.compare) as f:
+            regressions = compare(results, json.load(f), args.threshold)
+    print_report(results)
+
+    if args.save:
+        Path(args.save).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.save, "w") as f:
+            json.dump({"python": platform.python_version(), "machine": platform.machine(), "results": results}, f, indent=2)
+
+    for r in regressions:
+        print(f"REGRESSION {r['stage']} @ {r['size']:,} rows: {r['change']:+.0%}", file=sys.stderr)
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,5 +1,7 @@
 import streamlit as st
 
+from axelar.prewarm import get_refresher
+
 # --- Page Config: Tab Title & Icon ---
 st.set_page_config(
     page_title="Axelar: Bridging Blockchain Ecosystems",
@@ -117,3 +119,7 @@ st.sidebar.markdown(
     """,
     unsafe_allow_html=True
 )
+
+# --- Background Refresh ---
+# Started from the landing page so the dashboards' default ranges are warm before anyone opens them
+get_refresher()